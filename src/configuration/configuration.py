@@ -5,7 +5,7 @@
 
     Author: Jason Boyd
     Date: January 6, 2025
-    Modified: January 14, 2025
+    Modified: October 19, 2026
 """
 
 import configparser
@@ -121,4 +121,16 @@ def update_configuration(section, key, value):
     config.set(section, key, value)
     with open(get_configuration_path(), "w") as f:
         config.write(f)
-    
\ No newline at end of file
+    
+
+def get_journal_directory():
+    """Get the directory batch checkpoint journals are kept in, which lives next 
+        to the configuration file the application uses.
+
+    Returns:
+        pathlib.Path: the journal directory path (created when missing).
+    """
+
+    journal_directory = get_configuration_path().parent / "journals"
+    journal_directory.mkdir(exist_ok=True)
+    return journal_directory
@@ -6,12 +6,19 @@
 
     Author: Jason Boyd
     Date: January 6, 2025
-    Modified: January 14, 2025
+    Modified: October 19, 2026
 """
 
 import click
 import pathlib
+import contextlib
+import functools
 from templates import copy_template as ct
+from templates import backends
+from templates import manifest as mf
+from templates import results as cr
+from templates import journal as jr
+from templates import throttle as th
 from configuration import configuration as cfg
 
 @click.command()
@@ -19,7 +26,15 @@ from configuration import configuration as cfg
 @click.argument("destination", required=True, type=click.Path(dir_okay=True, path_type=pathlib.Path))
 @click.option("--uf", "--use-formatting", is_flag=True, default=False, help="Use formatting found in the destination.")
 @click.option("--n", "--number-copies", type=int, default=1, help="Number of template copies to make.")
-def copy_template(filename, destination, uf, n):
+@click.option("--progress", is_flag=True, default=False, help="Show progress while copying large templates.")
+@click.option("--archive", type=click.Path(dir_okay=False, path_type=pathlib.Path), default=None,
+    help="Write copies into this new .zip or .tar archive instead of the destination.")
+@click.option("--json", "json_file", type=click.File("w"), default=None,
+    help="Write the copy summary and failures as JSON to this file ('-' for stdout).")
+@click.option("--resume", is_flag=True, default=False, help="Continue an interrupted multiple copy from its journal.")
+@click.option("--rate", default=None, help="Limit a multiple copy to files/s (20) or bytes/s (4MB).")
+@click.option("--adaptive", is_flag=True, default=False, help="Back off a multiple copy when write latency climbs.")
+def copy_template(filename, destination, uf, n, progress, archive, json_file, resume, rate, adaptive):
     """Command to copy a template filename to a destination n times with option use 
         formatting uf. The function checks template configuration to get a usable 
         target directory from destination and attempts the copy operation.
@@ -29,22 +44,176 @@ def copy_template(filename, destination, uf, n):
         destination (pathlib.Path): the target directory to put copies in.
         uf (bool): analyze destination for formatting to use in the copy.
         n (int): the number of copies to make of the template file.
+        progress (bool): display bytes per second progress for large templates.
+        archive (pathlib.Path): stage the copies in this archive, with member names 
+            relative to destination, so they can be committed to the vault later.
+        json_file (file): export the results summary and every failed copy as JSON.
+        resume (bool): skip the copies an interrupted run of the same multiple copy 
+            already checkpointed in its journal.
+        rate (str): the target files per second or bytes per second of a multiple copy.
+        adaptive (bool): slow a multiple copy down while observed write latency climbs.
     """
 
-    results, usable_filename = [False], check_template_configuration(filename)
+    try: # parse the rate before touching any configuration or files
+        throttle = create_throttle(rate, adaptive)
+    except ValueError as ve:
+        raise click.BadParameter(str(ve), param_hint="--rate")
+    if archive is not None and archive.exists(): # archives are never overwritten or appended to
+        raise click.BadParameter(f"Archive file already exists: {archive}", param_hint="--archive")
+    if archive is not None and resume: # every archive run writes a new archive, so there is nothing to resume
+        raise click.BadParameter(
+            "Archive runs cannot be resumed, run the copy again into a new archive", param_hint="--resume"
+        )
+    # only multiple copies written straight into the destination are journaled and can resume
+    resumable = archive is None and n > 1
+
+    # keep stdout parseable when the JSON summary is written to it
+    err = json_file is not None and json_file.name == "<stdout>"
+    results, usable_filename = None, check_template_configuration(filename, err)
     try: # attempt to copy the template file to the destination using templates module
-        click.echo(f"Copying template file '{filename.name}' {n} time(s) to {destination.name}/.")
-        results = ct.copy_template(usable_filename, destination, use_formatting=uf, number_copies=n)
+        click.echo(f"Copying template file '{filename.name}' {n} time(s) to {destination.name}/.", err=err)
+        progress_callback = functools.partial(display_copy_progress, err=err) if progress else None
+        staging = contextlib.nullcontext() if archive is None else backends.ArchiveBackend(archive, root=destination)
+        batch_journal = contextlib.nullcontext()
+        if resumable:
+            batch_journal = open_batch_journal(usable_filename, destination, n, resume)
+        with staging as backend, batch_journal as journal:
+            results = ct.copy_template(
+                usable_filename, destination, use_formatting=uf, number_copies=n,
+                progress_callback=progress_callback, backend=backend, journal=journal, throttle=throttle,
+            )
+            if journal is not None and all(results):
+                journal.remove()
+    except KeyboardInterrupt:
+        resume_hint = ", run the same command with --resume to continue" if resumable else ""
+        click.echo(f"\nCopy interrupted{resume_hint}.", err=err)
+    except ValueError as ve:
+        click.echo(f"Cannot copy template file: {ve}", err=err)
     except FileExistsError as fee:
-        click.echo(f"Cannot copy template file to destination: {fee}")
+        click.echo(f"Cannot copy template file to destination: {fee}", err=err)
     except FileNotFoundError as fnfe:
-        click.echo(f"Cannot find template file location: {fnfe}")
-    results_message = (f"Template file '{filename.name}' copied {"" if all(results) else "un"}"
+        click.echo(f"Cannot find template file location: {fnfe}", err=err)
+    copied = results is not None and all(results)
+    results_message = (f"Template file '{filename.name}' copied {"" if copied else "un"}"
         f"successfully {n} time(s) to {usable_filename}.")
-    click.echo(results_message)
+    click.echo(results_message, err=err)
+    if results is not None and not copied:
+        status_counts = ", ".join(f"{count} {status}" for status, count in results.counts().items())
+        click.echo(f"Copy results: {status_counts}.", err=err)
+        if resumable:
+            click.echo("Fix the failed copies and run the same command with --resume to retry only those.", err=err)
+    if throttle is not None and throttle.files:
+        throttle_summary = throttle.summary()
+        megabytes_per_second = throttle_summary["bytes_per_second"] / (1024 * 1024)
+        click.echo(f"Effective throughput: {throttle_summary['files_per_second']:.1f} files/s "
+            f"({megabytes_per_second:.2f} MB/s), waited {throttle_summary['waited']:.1f}s"
+            + (f", backed off {throttle_summary['backoffs']} time(s)." if adaptive else "."), err=err)
+    if results is not None and json_file is not None:
+        json_file.write(results.to_json(indent=2) + "\n")
+
+
+def create_throttle(rate, adaptive):
+    """Create the throttle a multiple copy should be paced with from the command options.
+
+    Args:
+        rate (str): the target files per second or bytes per second, if any.
+        adaptive (bool): back off while observed write latency climbs.
+
+    Raises:
+        ValueError: if rate is not a valid files per second or bytes per second value.
+
+    Returns:
+        throttle.Throttle: the throttle to pace the copy with, or None to copy as fast 
+            as possible.
+    """
+
+    files_per_second, bytes_per_second = th.parse_rate(rate) if rate is not None else (None, None)
+    if adaptive:
+        return th.AdaptiveThrottle(files_per_second, bytes_per_second)
+    if rate is not None:
+        return th.Throttle(files_per_second, bytes_per_second)
+    return None
+
+
+@click.command()
+@click.argument("manifest", required=True, type=click.Path(dir_okay=False, exists=True, path_type=pathlib.Path))
+@click.option("--concurrency", type=click.IntRange(min=1), default=None,
+    help="Destinations per device written at once (overrides the manifest).")
+def run_manifest(manifest, concurrency):
+    """Command to run every template copy job in a TOML manifest, reading each template 
+        and scanning each destination only once, and print a combined summary.
+
+    Args:
+        manifest (pathlib.Path): the TOML manifest of jobs to run.
+        concurrency (int): the number of destinations on one device written at once, 
+            overriding the scheduler table of the manifest when supplied.
+    """
+
+    try: # attempt to load the manifest before running any of its jobs
+        loaded_manifest = mf.load_manifest(manifest)
+    except ValueError as ve:
+        click.echo(f"Cannot load manifest {manifest.name}: {ve}")
+        return
+    device_concurrency = concurrency or loaded_manifest["device_concurrency"]
+    jobs = loaded_manifest["jobs"]
+    click.echo(f"Running {len(jobs)} job(s) from manifest '{manifest.name}'.")
+
+    summaries = mf.run_manifest(jobs, device_concurrency=device_concurrency)
+    combined_results = cr.CopyResults()
+    for job, summary in zip(jobs, summaries):
+        job_results = summary["results"]
+        combined_results.extend(job_results)
+        job_message = f"  {summary['name']}: {job_results.succeeded}/{len(job_results)} copied to {job['destination']}"
+        if job_results.failed:
+            job_message += " (" + ", ".join(f"{count} {status}" for status, count in job_results.counts().items()) + ")"
+        click.echo(job_message + (f" ({summary['error']})" if summary["error"] else ""))
+    failed_jobs = sum(1 for summary in summaries if summary["error"] or summary["results"].failed)
+    click.echo(f"Manifest finished: {combined_results.succeeded}/{len(combined_results)} copies succeeded, "
+        f"{failed_jobs} job(s) had failures.")
+
+
+def open_batch_journal(template_file, destination, number_copies, resume):
+    """Open the checkpoint journal of a multiple copy, kept in the configuration 
+        journal directory under a name derived from the template, destination, 
+        and number of copies so the same command finds it again on resume.
+
+    Args:
+        template_file (pathlib.Path): the template file being copied.
+        destination (pathlib.Path): the target directory of the copies.
+        number_copies (int): the number of copies being made.
+        resume (bool): continue from the journal instead of starting a new one.
+
+    Returns:
+        contextlib.AbstractContextManager: the journal.BatchJournal of the copy, or 
+            a context holding None for single copies which are not journaled.
+    """
+
+    if number_copies <= 1:
+        return contextlib.nullcontext()
+    batch_name = jr.journal_name(pathlib.Path(template_file).resolve(), destination.resolve(), number_copies)
+    return jr.BatchJournal(cfg.get_journal_directory() / batch_name, resume=resume)
+
+
+def display_copy_progress(bytes_copied, total_bytes, bytes_per_second, err=False):
+    """Progress callback that draws a single updating progress line while a large 
+        template is streamed into its destination.
+
+    Args:
+        bytes_copied (int): the number of bytes copied so far.
+        total_bytes (int): the total number of bytes being copied.
+        bytes_per_second (float): the current copy rate in bytes per second.
+        err (bool, optional): draw the progress line on stderr instead of stdout.
+    """
+
+    percent = 100 * bytes_copied / total_bytes if total_bytes else 100
+    megabytes_per_second = bytes_per_second / (1024 * 1024)
+    progress_line = f"\r  {percent:5.1f}% {bytes_copied}/{total_bytes} bytes ({megabytes_per_second:.1f} MB/s)"
+    click.echo(progress_line, nl=False, err=err)
+    if bytes_copied >= total_bytes:
+        click.echo(err=err)
     
 
-def check_template_configuration(template_file):
+def check_template_configuration(template_file, err=False):
     """Given a template file path, save or update template path configuration if 
         necessary and return a usable template location path based on what the 
         caller supplied; if just a filename, use configuration otherwise use 
@@ -53,6 +222,7 @@ def check_template_configuration(template_file):
     Args:
         template_file (pathlib.Path): the template file location to analyze 
             and possibly update configuration for.
+        err (bool, optional): ask configuration questions on stderr instead of stdout.
 
     Returns:
         pathlib.Path: the usable path to copy the template file from.
@@ -72,12 +242,12 @@ def check_template_configuration(template_file):
         template_parent_path = str(template_file.parent.resolve())
         if not configured_template_path:
             confirm_message = f"Would you like to set the default template directory to {template_parent_path}?"
-            if click.confirm(confirm_message):
+            if click.confirm(confirm_message, err=err):
                 cfg.update_configuration("TEMPLATE", "directory", template_parent_path)
             handled_template_configuration = True
         # if the configured template path and suppled template path don't match, ask to update
         if configured_template_path != template_parent_path and not handled_template_configuration:
             confirm_message = f"Would you like to update the default template directory to {template_parent_path}?"
-            if click.confirm(confirm_message):
+            if click.confirm(confirm_message, err=err):
                 cfg.update_configuration("TEMPLATE", "directory", template_parent_path)
     return template_file
\ No newline at end of file
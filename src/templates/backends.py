@@ -0,0 +1,504 @@
+"""
+    Filesystem backends used by the template copy functions. Every listing, 
+    stat, directory creation, and write performed while copying templates goes 
+    through a backend so bulk runs can be staged without touching the vault: 
+    LocalBackend works directly on disk (the default), MemoryBackend keeps the 
+    whole tree in memory, and ArchiveBackend streams written notes into a single 
+    zip or tar archive that can be committed to the vault later.
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import abc
+import collections
+import pathlib
+import tarfile
+import tempfile
+import zipfile
+import shutil
+import time
+import mmap
+import os
+from stat import S_IMODE, S_ISDIR, S_ISREG
+
+# templates larger than this many bytes are streamed instead of copied at once
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# the number of bytes moved per chunk when streaming a large template
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# the subset of stat information the copy functions rely on from a backend
+EntryStat = collections.namedtuple("EntryStat", ["is_file", "is_dir", "size", "mode", "device"])
+
+
+def report_progress(progress_callback, bytes_copied, total_bytes, started):
+    """Report streaming progress to the caller supplied progress_callback, if any.
+
+    Args:
+        progress_callback (callable): called with the bytes copied so far, the 
+            total bytes to copy, and the current bytes per second rate.
+        bytes_copied (int): the number of bytes copied so far.
+        total_bytes (int): the total number of bytes being copied.
+        started (float): the time.monotonic() value the copy started at.
+    """
+
+    if progress_callback is None:
+        return
+    elapsed = time.monotonic() - started
+    bytes_per_second = bytes_copied / elapsed if elapsed > 0 else 0.0
+    progress_callback(bytes_copied, total_bytes, bytes_per_second)
+
+
+def stream_template_copy(template_path, target_file, chunk_size=STREAM_CHUNK_SIZE, progress_callback=None):
+    """Stream template_path into target_file in fixed-size chunks so memory stays flat 
+        no matter how large the template is. The kernel os.sendfile is used where the 
+        platform supports file to file transfers, otherwise the template is memory-mapped 
+        and written out chunk by chunk.
+
+    Args:
+        template_path (pathlib.Path): the template path-like object to copy from.
+        target_file (pathlib.Path): the target path-like object to copy to.
+        chunk_size (int, optional): the number of bytes moved per chunk, and defaults 
+            to STREAM_CHUNK_SIZE.
+        progress_callback (callable, optional): called after every chunk with the bytes 
+            copied so far, the total bytes, and the current bytes per second rate.
+
+    Raises:
+        FileExistsError: if the target_file already exists in the filesystem
+
+    Returns:
+        int: the number of bytes copied into target_file.
+    """
+
+    started = time.monotonic()
+    bytes_copied = 0
+    with open(template_path, "rb") as source, open(target_file, "xb") as target:
+        try:
+            total_bytes = os.fstat(source.fileno()).st_size
+            use_sendfile = hasattr(os, "sendfile")
+            while use_sendfile and bytes_copied < total_bytes:
+                try: # some platforms (macOS) only sendfile into sockets, fall back to mmap
+                    count = min(chunk_size, total_bytes - bytes_copied)
+                    sent = os.sendfile(target.fileno(), source.fileno(), bytes_copied, count)
+                except OSError:
+                    use_sendfile = False
+                    break
+                if sent == 0:
+                    break
+                bytes_copied += sent
+                report_progress(progress_callback, bytes_copied, total_bytes, started)
+
+            if bytes_copied < total_bytes:
+                target.seek(bytes_copied)
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for offset in range(bytes_copied, total_bytes, chunk_size):
+                        target.write(mapped[offset:offset + chunk_size])
+                        bytes_copied = min(offset + chunk_size, total_bytes)
+                        report_progress(progress_callback, bytes_copied, total_bytes, started)
+        except BaseException:
+            # never leave a partially written note behind in the target directory
+            target.close()
+            pathlib.Path(target_file).unlink(missing_ok=True)
+            raise
+
+    shutil.copymode(template_path, target_file)
+    return bytes_copied
+
+
+class FilesystemBackend(abc.ABC):
+    """Base backend describing the list, stat, create, and write operations the 
+        template copy functions use. Subclasses implement resolve(), stat(), list(), 
+        create(), read(), write(), and remove(); copy() and read_bytes() are built on 
+        top of them.
+    """
+
+    @abc.abstractmethod
+    def resolve(self, path):
+        """Turn a caller supplied path into the absolute path the backend stores.
+
+        Args:
+            path (str or path-like object): the path to resolve.
+
+        Returns:
+            pathlib.Path: the absolute path used as the backend key.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stat(self, path):
+        """Get the stat information of path, or None when nothing exists at path.
+
+        Args:
+            path (pathlib.Path): the resolved path to stat.
+
+        Returns:
+            EntryStat: the stat information of the entry, or None if it does not exist.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list(self, directory):
+        """List the entry names within directory.
+
+        Args:
+            directory (pathlib.Path): the resolved directory to list.
+
+        Returns:
+            list: the names of every file and directory within directory.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def create(self, directory):
+        """Create directory and any missing parents, succeeding if it already exists.
+
+        Args:
+            directory (pathlib.Path): the resolved directory to create.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def read(self, path, chunk_size=STREAM_CHUNK_SIZE):
+        """Read the file at path in chunks of at most chunk_size bytes.
+
+        Args:
+            path (pathlib.Path): the resolved file path to read.
+            chunk_size (int, optional): the maximum size of each chunk.
+
+        Returns:
+            iterator: the bytes chunks of the file.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def write(self, path, chunks, mode=None):
+        """Create the file at path exclusively and write chunks into it.
+
+        Args:
+            path (pathlib.Path): the resolved file path to create.
+            chunks (iterable): the bytes chunks to write into the file.
+            mode (int, optional): the permission bits to give the new file.
+
+        Raises:
+            FileExistsError: if something already exists at path.
+            FileNotFoundError: if the parent directory of path does not exist.
+        """
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove(self, path):
+        """Delete the file at path.
+
+        Args:
+            path (pathlib.Path): the resolved file path to delete.
+
+        Raises:
+            FileNotFoundError: if no file exists at path.
+        """
+
+        raise NotImplementedError
+
+    def read_bytes(self, path):
+        """Read the whole file at path into memory.
+
+        Args:
+            path (pathlib.Path): the resolved file path to read.
+
+        Returns:
+            bytes: the contents of the file.
+        """
+
+        return b"".join(self.read(path))
+
+    def copy(self, source, target, progress_callback=None):
+        """Copy the file at source into a new file at target, chunk by chunk.
+
+        Args:
+            source (pathlib.Path): the resolved file path to copy from.
+            target (pathlib.Path): the resolved file path to copy to.
+            progress_callback (callable, optional): called after every chunk with the 
+                bytes copied so far, the total bytes, and the bytes per second rate.
+
+        Returns:
+            int: the number of bytes copied into target.
+        """
+
+        source_stat = self.stat(source)
+        if source_stat is None:
+            raise FileNotFoundError(f"Source file does not exist: {source}")
+        if source_stat.is_dir:
+            raise IsADirectoryError(f"Source file is a directory: {source}")
+
+        started, bytes_copied = time.monotonic(), 0
+
+        def counted_chunks():
+            nonlocal bytes_copied
+            for chunk in self.read(source):
+                yield chunk
+                bytes_copied += len(chunk)
+                report_progress(progress_callback, bytes_copied, source_stat.size, started)
+
+        self.write(target, counted_chunks(), source_stat.mode)
+        return bytes_copied
+
+
+class LocalBackend(FilesystemBackend):
+    """Backend that works directly on the local disk through os, pathlib, and shutil."""
+
+    def resolve(self, path):
+        return pathlib.Path(path).resolve()
+
+    def stat(self, path):
+        try:
+            path_stat = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        is_dir, is_file = S_ISDIR(path_stat.st_mode), S_ISREG(path_stat.st_mode)
+        mode = S_IMODE(path_stat.st_mode)
+        return EntryStat(is_file, is_dir, path_stat.st_size, mode, path_stat.st_dev)
+
+    def list(self, directory):
+        return os.listdir(directory)
+
+    def create(self, directory):
+        pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+
+    def read(self, path, chunk_size=STREAM_CHUNK_SIZE):
+        with open(path, "rb") as source:
+            while chunk := source.read(chunk_size):
+                yield chunk
+
+    def write(self, path, chunks, mode=None):
+        with open(path, "xb") as target:
+            try:
+                for chunk in chunks:
+                    target.write(chunk)
+            except BaseException:
+                # never leave a partially written note behind in the target directory
+                target.close()
+                pathlib.Path(path).unlink(missing_ok=True)
+                raise
+        if mode is not None:
+            os.chmod(path, mode)
+
+    def remove(self, path):
+        os.unlink(path)
+
+    def copy(self, source, target, progress_callback=None):
+        source_stat = self.stat(source)
+        if source_stat is not None and source_stat.size > STREAM_THRESHOLD:
+            return stream_template_copy(source, target, progress_callback=progress_callback)
+        # small templates go through write() so they are created exclusively and never left half written
+        return super().copy(source, target, progress_callback)
+
+
+class MemoryBackend(FilesystemBackend):
+    """Backend that keeps every directory and file in memory, which is useful for 
+        staging large generation runs and for tests. Only the root directory exists 
+        when the backend is created; use create() and write() to populate it.
+    """
+
+    def __init__(self):
+        root = self.resolve("/")
+        self.files = {}
+        self.modes = {}
+        self.children = {root: set()}
+
+    def resolve(self, path):
+        return pathlib.Path(os.path.abspath(path))
+
+    def stat(self, path):
+        path = self.resolve(path)
+        if path in self.children:
+            return EntryStat(False, True, 0, 0o755, 0)
+        if path in self.files:
+            return EntryStat(True, False, len(self.files[path]), self.modes[path], 0)
+        return None
+
+    def list(self, directory):
+        directory = self.resolve(directory)
+        if directory in self.files:
+            raise NotADirectoryError(f"Not a directory: {directory}")
+        if directory not in self.children:
+            raise FileNotFoundError(f"No such directory: {directory}")
+        return list(self.children[directory])
+
+    def create(self, directory):
+        directory = self.resolve(directory)
+        if directory in self.files:
+            raise FileExistsError(f"File exists: {directory}")
+        if directory in self.children:
+            return
+        self.create(directory.parent)
+        self.children[directory] = set()
+        self.children[directory.parent].add(directory.name)
+
+    def read(self, path, chunk_size=STREAM_CHUNK_SIZE):
+        path = self.resolve(path)
+        if path in self.children:
+            raise IsADirectoryError(f"Is a directory: {path}")
+        if path not in self.files:
+            raise FileNotFoundError(f"No such file: {path}")
+        contents = memoryview(self.files[path])
+        for offset in range(0, len(contents), chunk_size):
+            yield bytes(contents[offset:offset + chunk_size])
+
+    def write(self, path, chunks, mode=None):
+        path = self.resolve(path)
+        if path in self.files or path in self.children:
+            raise FileExistsError(f"File exists: {path}")
+        if path.parent not in self.children:
+            raise FileNotFoundError(f"No such directory: {path.parent}")
+        self.files[path] = b"".join(chunks)
+        self.modes[path] = 0o644 if mode is None else mode
+        self.children[path.parent].add(path.name)
+
+    def remove(self, path):
+        path = self.resolve(path)
+        if path in self.children:
+            raise IsADirectoryError(f"Is a directory: {path}")
+        if path not in self.files:
+            raise FileNotFoundError(f"No such file: {path}")
+        del self.files[path], self.modes[path]
+        self.children[path.parent].discard(path.name)
+
+
+class ArchiveBackend(FilesystemBackend):
+    """Backend that overlays a write-only zip or tar archive on top of a source 
+        backend. Templates are read and directories are listed through the source 
+        (the local disk by default) while every written file is streamed into the 
+        archive, so a bulk run can be reviewed and committed to the vault later.
+
+    Args:
+        archive_file (str or path-like object): the archive to create, where a .zip 
+            suffix writes a zip archive and anything else (.tar, .tar.gz) a tar archive.
+        root (str or path-like object, optional): the directory archive member names 
+            are made relative to, and defaults to the filesystem root.
+        source (FilesystemBackend, optional): the backend to read templates and list 
+            directories through, and defaults to LocalBackend().
+    """
+
+    def __init__(self, archive_file, root=None, source=None):
+        self.source = LocalBackend() if source is None else source
+        self.archive_file = pathlib.Path(archive_file)
+        self.root = self.source.resolve(root if root is not None else "/")
+        self.entries = {}
+        self.children = collections.defaultdict(set)
+        if self.archive_file.suffix == ".zip":
+            self.archive = zipfile.ZipFile(self.archive_file, "x", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self.archive = tarfile.open(self.archive_file, "x:gz" if self.archive_file.suffix == ".gz" else "x")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Finish writing the archive, after which nothing else can be written."""
+
+        self.archive.close()
+
+    def member_name(self, path):
+        """Get the archive member name that path is stored under.
+
+        Args:
+            path (pathlib.Path): the resolved path within the archive.
+
+        Returns:
+            str: the member name relative to the archive root.
+        """
+
+        return path.relative_to(self.root).as_posix()
+
+    def resolve(self, path):
+        return self.source.resolve(path)
+
+    def stat(self, path):
+        if path in self.entries:
+            return self.entries[path]
+        return self.source.stat(path)
+
+    def list(self, directory):
+        source_stat = self.source.stat(directory)
+        listed = set(self.source.list(directory)) if source_stat and source_stat.is_dir else set()
+        return list(listed | self.children[directory])
+
+    def create(self, directory):
+        if self.stat(directory) is not None:
+            if not self.stat(directory).is_dir:
+                raise FileExistsError(f"File exists: {directory}")
+            return
+        self.create(directory.parent)
+        if isinstance(self.archive, zipfile.ZipFile):
+            self.archive.mkdir(self.member_name(directory))
+        else:
+            member = tarfile.TarInfo(self.member_name(directory))
+            member.type, member.mode, member.mtime = tarfile.DIRTYPE, 0o755, time.time()
+            self.archive.addfile(member)
+        self.entries[directory] = EntryStat(False, True, 0, 0o755, 0)
+        self.children[directory.parent].add(directory.name)
+
+    def read(self, path, chunk_size=STREAM_CHUNK_SIZE):
+        if path in self.entries:
+            raise PermissionError(f"Archive members are write-only: {path}")
+        return self.source.read(path, chunk_size)
+
+    def remove(self, path):
+        raise PermissionError(f"Cannot remove files through an archive backend: {path}")
+
+    def write(self, path, chunks, mode=None):
+        if self.stat(path) is not None:
+            raise FileExistsError(f"File exists: {path}")
+        parent_stat = self.stat(path.parent)
+        if parent_stat is None or not parent_stat.is_dir:
+            raise FileNotFoundError(f"No such directory: {path.parent}")
+
+        mode = 0o644 if mode is None else mode
+        size = 0
+        if isinstance(self.archive, zipfile.ZipFile):
+            member = zipfile.ZipInfo(self.member_name(path), date_time=time.localtime()[:6])
+            member.external_attr = (0o100000 | mode) << 16
+            member.compress_type = zipfile.ZIP_DEFLATED
+            with self.archive.open(member, "w") as target:
+                for chunk in chunks:
+                    target.write(chunk)
+                    size += len(chunk)
+        else:
+            # tar members need their size up front, so spool the chunks first
+            with tempfile.SpooledTemporaryFile(max_size=STREAM_CHUNK_SIZE) as spooled:
+                for chunk in chunks:
+                    spooled.write(chunk)
+                    size += len(chunk)
+                spooled.seek(0)
+                member = tarfile.TarInfo(self.member_name(path))
+                member.size, member.mode, member.mtime = size, mode, time.time()
+                self.archive.addfile(member, spooled)
+        self.entries[path] = EntryStat(True, False, size, mode, 0)
+        self.children[path.parent].add(path.name)
+
+
+# the backend the copy functions use when the caller does not supply one
+DEFAULT_BACKEND = LocalBackend()
+
+
+def use_backend(backend=None):
+    """Get the backend a copy function should use given what the caller supplied.
+
+    Args:
+        backend (FilesystemBackend, optional): the caller supplied backend.
+
+    Returns:
+        FilesystemBackend: the supplied backend, or DEFAULT_BACKEND if none was supplied.
+    """
+
+    return DEFAULT_BACKEND if backend is None else backend
@@ -8,7 +8,7 @@
 
     Author: Jason Boyd
     Date: January 3, 2025
-    Modified: January 9, 2025
+    Modified: October 19, 2026
 """
 
 # TODO:
@@ -16,7 +16,8 @@
 
 import pathlib
 import datetime
-import shutil
+from templates import backends
+from templates import results as cr
 
 
 def compute_spread(string_list):
@@ -78,13 +79,15 @@ def iso_proper_length_parts(iso_part_list):
     return True
 
 
-def process_template_location(template_object):
+def process_template_location(template_object, backend=None):
     """Given a template object (should be str), perform checks to ensure the supplied 
         path exists and is an actual file and not a directory to be copied from.
 
     Args:
         template_object (str or path-like object): the template path to analyze 
             and create a pathlib.Path from.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            check the template in, and defaults to the local disk.
 
     Raises:
         FileNotFoundError: file location does not exist or is not a real file.
@@ -95,7 +98,8 @@ def process_template_location(template_object):
     """
     
     # grab the resolved path from the template_object location for processing
-    path_instance = pathlib.Path(template_object).resolve()
+    backend = backends.use_backend(backend)
+    path_instance = backend.resolve(template_object)
 
     if path_instance.name == template_object: # caller just supplied a name of file
         # TODO: check to see if program has template path saved
@@ -103,24 +107,27 @@ def process_template_location(template_object):
         if not template_saved:
             raise FileNotFoundError(f"Template location not found: {template_object}")
         
-    if not path_instance.exists():
+    path_stat = backend.stat(path_instance)
+    if path_stat is None:
         raise FileNotFoundError(f"Template object does not exist: {template_object}")
-    if path_instance.is_dir():
+    if path_stat.is_dir:
         raise IsADirectoryError(f"Template object is a directory: {template_object}")
-    if not path_instance.is_file():
+    if not path_stat.is_file:
         raise FileNotFoundError(f"Template object is not a valid file: {template_object}")
     
     # determined that template_object is a good file for copying from
     return path_instance
 
 
-def process_directory_location(target_directory):
+def process_directory_location(target_directory, backend=None):
     """Given a target directory (should be str), perform checks to ensure the 
         supplied directory exists and can be used to copy to.
 
     Args:
         target_directory (str or path-like object): the target path to analayze 
             and create a pathlib.Path from.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            check the directory in, and defaults to the local disk.
 
     Raises:
         FileNotFoundError: directory location does not exist or is not a directory.
@@ -130,16 +137,18 @@ def process_directory_location(target_directory):
         pathlib.Path: the Path() created from processing the target directory.
     """
 
-    path_instance = pathlib.Path(target_directory).resolve()
+    backend = backends.use_backend(backend)
+    path_instance = backend.resolve(target_directory)
 
     if path_instance.name == target_directory: # caller supplied a name of directory
         raise FileNotFoundError(f"Target directory should be directory path: {target_directory}")
     
-    if not path_instance.exists():
+    path_stat = backend.stat(path_instance)
+    if path_stat is None:
         raise FileNotFoundError(f"Target directory does not exist: {target_directory}")
-    if path_instance.is_file():
+    if path_stat.is_file:
         raise NotADirectoryError(f"Target directory is a file: {target_directory}")
-    if not path_instance.is_dir():
+    if not path_stat.is_dir:
         raise FileNotFoundError(f"Target directory is not a valid directory: {target_directory}")
     
     # determined that target_directory is a good directory for copying to
@@ -199,34 +208,56 @@ def iso_formatted_list(string_list, common_characters):
     return (False, None)
     
 
-def copy_template_handler(template_path, target_file):
-    """Handler function that actually does the copying of template_path using shutil.
+def check_target_file(target_file, backend=None):
+    """Ensure nothing exists at target_file yet so a template can be copied there.
 
     Args:
-        template_path (pathlib.Path): the template path-like object to copy from.
-        target_file (pathlib.Path): the target path-like object to copy to.
+        target_file (pathlib.Path): the target path-like object to check.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            check within, and defaults to the local disk.
 
     Raises:
         FileExistsError: if the target_file already exists in the filesystem
         IsADirectoryError: if the target_file is a directory
+    """
+
+    target_stat = backends.use_backend(backend).stat(target_file)
+    if target_stat is not None and target_stat.is_dir:
+        raise IsADirectoryError(f"Target file is a directory: {target_file}")
+    elif target_stat is not None:
+        raise FileExistsError(f"Target file already exists: {target_file}")
+
+
+def record_copy_handler(results, index, template_path, target_file, progress_callback=None, backend=None):
+    """Handler function that actually does the copying of template_path through the 
+        filesystem backend, which streams templates larger than STREAM_THRESHOLD bytes, 
+        and records the outcome (including why the copy failed) in results.
+
+    Args:
+        results (results.CopyResults): the batch results to record the outcome in.
+        index (int): the index of target_file within its batch.
+        template_path (pathlib.Path): the template path-like object to copy from.
+        target_file (pathlib.Path): the target path-like object to copy to.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is streamed, see backends.stream_template_copy().
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
 
     Returns:
         bool: wether the copy of template_path to target_file succeeded or not.
     """
-    
-    if target_file.is_file():
-        raise FileExistsError(f"Target file already exists: {target_file}")
-    elif target_file.is_dir():
-        raise IsADirectoryError(f"Target file is a directory: {target_file}")
-    
-    try: # attempt to perform the actual copy of the template into target
-        shutil.copy(template_path, target_file)
+
+    backend = backends.use_backend(backend)
+
+    def copy_call():
+        check_target_file(target_file, backend)
+        backend.copy(template_path, target_file, progress_callback)
         return True
-    except:
-        return False
+
+    return results.record(index, copy_call)
 
 
-def copy_template_single(template_path, target_path, use_formatting=True):
+def copy_template_single(template_path, target_path, use_formatting=True, progress_callback=None, backend=None):
     """Copy a single template file to the target path, optionally using existing formatting.
 
     Args:
@@ -235,33 +266,147 @@ def copy_template_single(template_path, target_path, use_formatting=True):
         use_formatting (bool, optional): optionally use potentially existing formatting 
         in the target directory. If ISO formatting is found, the copied file will 
         utilize today's date as its file name. Defaults to True.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is large enough to be streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
 
     Returns:
-        bool: wether the copy succeeded or not based on further function calls.
+        results.CopyResults: the status, errno, index, and timing of the copy.
     """
 
-    analyze_results = analyze_directory(target_path)
+    analyze_results = analyze_directory(target_path, backend=backend)
+    target_name = single_target_name(template_path, analyze_results, use_formatting)
+    target_file = target_path.joinpath(target_name)
+    results = cr.CopyResults()
+    record_copy_handler(results, 0, template_path, target_file, progress_callback, backend)
+    return results
+
+
+def single_target_name(template_path, analyze_results, use_formatting=True):
+    """Determine the file name a single copy of template_path should receive given the 
+        analysis results of the target directory.
+
+    Args:
+        template_path (pathlib.Path): the template file path being copied from.
+        analyze_results (dict): the analysis object returned from analyze_directory().
+        use_formatting (bool, optional): optionally use the formatting found in the 
+            analysis results, and defaults to True.
+
+    Returns:
+        str: the file name (including suffix) to copy the template into.
+    """
+
+    default_name = template_path.stem + "-copy" + template_path.suffix
     # if caller doesn't want to use formatting or couldn't find formatting
     if not use_formatting or not analyze_results["detected_formatting"]:
-        target_name = template_path.stem + "-copy" + template_path.suffix
-        target_file = target_path.joinpath(target_name)
-        return [copy_template_handler(template_path, target_file)]
+        return default_name
 
-    single_file = None
     match analyze_results["formatting_type"]:
         case "ISO":
-            todays_date_iso = datetime.date.today().isoformat()
-            todays_file_name = template_path.stem + "-copy" + template_path.suffix
-            found_separator = analyze_results["formatting_separator"]
-            todays_file_name = todays_date_iso.replace("-", found_separator if found_separator else "")
-            todays_file_full = todays_file_name + template_path.suffix
-            single_file = target_path.joinpath(todays_file_full)
+            return date_target_name(template_path, datetime.date.today(), analyze_results)
         case _:
-            pass
-    return [copy_template_handler(template_path, single_file)]
+            return default_name
+
+
+def date_target_name(template_path, date, analyze_results, use_formatting=True):
+    """Determine the ISO date file name a copy of template_path made for date should receive, 
+        following the ISO separator found in the analysis results when there is one.
+
+    Args:
+        template_path (pathlib.Path): the template file path being copied from.
+        date (datetime.date): the date the copy is made for.
+        analyze_results (dict): the analysis object returned from analyze_directory().
+        use_formatting (bool, optional): optionally use the separator found in the 
+            analysis results instead of "-", and defaults to True.
+
+    Returns:
+        str: the file name (including suffix) to copy the template into.
+    """
+
+    date_iso = date.isoformat()
+    if use_formatting and analyze_results["formatting_type"] == "ISO":
+        found_separator = analyze_results["formatting_separator"]
+        date_iso = date_iso.replace("-", found_separator if found_separator else "")
+    return date_iso + template_path.suffix
+
+
+def date_range(start_date, end_date):
+    """Generate every date from start_date through end_date (inclusive).
+
+    Args:
+        start_date (datetime.date): the first date of the range.
+        end_date (datetime.date): the last date of the range.
+
+    Raises:
+        ValueError: if end_date comes before start_date.
+
+    Returns:
+        list: the dates of the range in order.
+    """
+
+    if end_date < start_date:
+        raise ValueError(f"Date range ends ({end_date}) before it starts ({start_date})")
+    return [start_date + datetime.timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+
+def copy_template_date_range(
+    template_path, target_path, start_date, end_date, use_formatting=True, progress_callback=None, backend=None,
+    journal=None, throttle=None,
+):
+    """Copy template file to the target path once for every date from start_date through 
+        end_date, naming each copy with its ISO date.
+
+    Args:
+        template_path (pathlib.Path): the template file path to copy from
+        target_path (pathlib.Path): the target directory path to copy into
+        start_date (datetime.date): the first date to make a copy for.
+        end_date (datetime.date): the last date to make a copy for.
+        use_formatting (bool, optional): optionally follow the ISO separator found in 
+            the target directory, and defaults to True.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is large enough to be streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+        journal (journal.BatchJournal, optional): checkpoint every finished copy in this 
+            journal, resuming from it when it was opened with resume=True.
+        throttle (throttle.Throttle, optional): pace the copies to the throttle's 
+            target rate, and defaults to copying as fast as possible.
+
+    Raises:
+        ValueError: if end_date comes before start_date, or journal records a 
+            different batch.
+
+    Returns:
+        results.CopyResults: the status, errno, index, and timing of every copy.
+    """
+
+    dates = date_range(start_date, end_date)
+    plan = {
+        "kind": "date_range",
+        "template": str(template_path),
+        "destination": str(target_path),
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "use_formatting": use_formatting,
+    }
+    resumed_plan = journal.resume(plan) if journal is not None else None
+    if resumed_plan is not None: # the journal remembers the analysis, don't scan the directory again
+        analyze_results = resumed_plan["analyze_results"]
+    else:
+        analyze_results = analyze_directory(target_path, backend=backend)
+        if journal is not None:
+            journal.start({**plan, "analyze_results": analyze_results})
+
+    target_names = (date_target_name(template_path, date, analyze_results, use_formatting) for date in dates)
+    return copy_template_batch(
+        template_path, target_path, target_names, progress_callback, backend, journal, throttle
+    )
         
 
-def copy_template_multiple(template_path, target_path, number_copies=1):
+def copy_template_multiple(
+    template_path, target_path, number_copies=1, progress_callback=None, backend=None, journal=None, throttle=None
+):
     """Copy template file to the target path number_copies times.
 
     Args:
@@ -269,20 +414,133 @@ def copy_template_multiple(template_path, target_path, number_copies=1):
         target_path (pathlib.Path): the target directory path to copy into
         number_copies (int): the number of copies to make of template_path 
             into target_path.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is large enough to be streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+        journal (journal.BatchJournal, optional): checkpoint every finished copy in this 
+            journal, resuming from it when it was opened with resume=True.
+        throttle (throttle.Throttle, optional): pace the copies to the throttle's 
+            target rate, and defaults to copying as fast as possible.
+
+    Raises:
+        ValueError: if journal records a different batch.
 
     Returns:
-        list: wether the copies succeeded or not based on further function calls.
+        results.CopyResults: the status, errno, index, and timing of every copy.
     """
 
-    results = []
-    for index in range(0, number_copies):
-        target_name = template_path.stem + f"-copy-{index}" + template_path.suffix
+    plan = {
+        "kind": "multiple",
+        "template": str(template_path),
+        "destination": str(target_path),
+        "count": number_copies,
+    }
+    if journal is not None and journal.resume(plan) is None:
+        journal.start(plan)
+
+    target_names = (multiple_target_name(template_path, index) for index in range(0, number_copies))
+    return copy_template_batch(
+        template_path, target_path, target_names, progress_callback, backend, journal, throttle
+    )
+
+
+def copy_template_batch(
+    template_path, target_path, target_names, progress_callback=None, backend=None, journal=None, throttle=None
+):
+    """Copy template file to the target path once for every name in target_names, skipping 
+        and checkpointing targets through journal when one is supplied.
+
+    Args:
+        template_path (pathlib.Path): the template file path to copy from
+        target_path (pathlib.Path): the target directory path to copy into
+        target_names (iterable): the file names to copy into, in index order.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is large enough to be streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+        journal (journal.BatchJournal, optional): the started or resumed journal of 
+            the batch to skip completed targets from and checkpoint copies into.
+        throttle (throttle.Throttle, optional): pace the copies to the throttle's 
+            target rate, and defaults to copying as fast as possible.
+
+    Returns:
+        results.CopyResults: the status, errno, index, and timing of every copy made, 
+            which leaves out targets the journal already recorded as copied.
+    """
+
+    results = cr.CopyResults()
+    template_size = backends.use_backend(backend).stat(template_path).size if throttle is not None else 0
+    for index, target_name in enumerate(target_names):
+        if journal is not None and journal.is_completed(index):
+            continue
         target_file = target_path.joinpath(target_name)
-        results.append(copy_template_handler(template_path, target_file))
+        if journal is not None and index in journal.in_flight:
+            if resume_in_flight_target(template_path, target_file, backend):
+                results.append(index, cr.SUCCEEDED)
+                journal.record(index, True)
+                continue
+        if throttle is not None:
+            throttle.before_copy()
+        if journal is not None:
+            journal.begin(index)
+        succeeded = record_copy_handler(results, index, template_path, target_file, progress_callback, backend)
+        if throttle is not None:
+            throttle.after_copy(template_size if succeeded else 0, results.durations[-1])
+        if journal is not None:
+            journal.record(index, succeeded)
     return results
 
 
-def copy_template(template_object, target_directory, use_formatting=True, number_copies=1):
+def resume_in_flight_target(template_path, target_file, backend=None):
+    """Settle the target that was being copied when a journaled batch was interrupted. 
+        A target holding the whole template counts as copied, and a target holding only 
+        the start of the template was cut off mid-copy and is removed so it can be copied 
+        again. Anything else is left alone and will be reported as an existing file.
+
+    Args:
+        template_path (pathlib.Path): the template file path being copied from.
+        target_file (pathlib.Path): the target that may have been copied part way.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+
+    Returns:
+        bool: wether target_file already holds a complete copy of the template.
+    """
+
+    backend = backends.use_backend(backend)
+    target_stat, template_stat = backend.stat(target_file), backend.stat(template_path)
+    if target_stat is None or not target_stat.is_file or target_stat.size > template_stat.size:
+        return False
+
+    # both files are read with the same chunk size, so the chunks line up by offset
+    for target_chunk, template_chunk in zip(backend.read(target_file), backend.read(template_path)):
+        if not template_chunk.startswith(target_chunk):
+            return False
+    if target_stat.size == template_stat.size:
+        return True
+    backend.remove(target_file)
+    return False
+
+
+def multiple_target_name(template_path, index):
+    """Determine the file name the copy at index of a multiple copy should receive.
+
+    Args:
+        template_path (pathlib.Path): the template file path being copied from.
+        index (int): the position of the copy within the multiple copy.
+
+    Returns:
+        str: the file name (including suffix) to copy the template into.
+    """
+
+    return template_path.stem + f"-copy-{index}" + template_path.suffix
+
+
+def copy_template(
+    template_object, target_directory, use_formatting=True, number_copies=1, progress_callback=None, backend=None,
+    journal=None, throttle=None,
+):
     """The top-level copy function that should be used by the caller.
 
     Args:
@@ -292,31 +550,48 @@ def copy_template(template_object, target_directory, use_formatting=True, number
             target_directory, and defaults to True.
         number_copies (int, optional): the number of copies to make of the template_object 
             into target_directory, and defaults to 1.
+        progress_callback (callable, optional): called with the bytes copied, the total 
+            bytes, and the bytes per second rate while large templates are streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+        journal (journal.BatchJournal, optional): checkpoint a multiple copy in this 
+            journal, resuming from it when it was opened with resume=True.
+        throttle (throttle.Throttle, optional): pace a multiple copy to the throttle's 
+            target rate, and defaults to copying as fast as possible.
 
     Raises:
-        ValueError: if the number of copies is some un-copiable (less than zero) number.
+        ValueError: if the number of copies is some un-copiable (less than zero) number, 
+            or journal records a different batch.
 
     Returns:
-        bool: wether the copy succeeded or not based on further function calls.
+        results.CopyResults: the status, errno, index, and timing of every copy.
     """
 
     if number_copies < 0: # cannot copy less than zero times
         raise ValueError(f"Cannot copy notes {number_copies} of times")
 
-    template_path = process_template_location(template_object)
-    target_path = process_directory_location(target_directory)
+    template_path = process_template_location(template_object, backend=backend)
+    target_path = process_directory_location(target_directory, backend=backend)
 
     if number_copies == 1:
-        return copy_template_single(template_path, target_path, use_formatting=use_formatting)
-    return copy_template_multiple(template_path, target_path, number_copies=number_copies)
+        return copy_template_single(
+            template_path, target_path, use_formatting=use_formatting, progress_callback=progress_callback,
+            backend=backend,
+        )
+    return copy_template_multiple(
+        template_path, target_path, number_copies=number_copies, progress_callback=progress_callback,
+        backend=backend, journal=journal, throttle=throttle,
+    )
 
 
-def analyze_directory(directory):
+def analyze_directory(directory, backend=None):
     """Given a directory, analyze the files within and determine if they match some 
         sort of formatting pattern.
 
     Args:
         directory (str): the directory to analyze against.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            list the directory through, and defaults to the local disk.
 
     Returns:
         dict: the information object that contains elements that include if formatting 
@@ -324,15 +599,28 @@ def analyze_directory(directory):
             between formatted elements.
     """
 
+    backend = backends.use_backend(backend)
+    path_directory = process_directory_location(directory, backend=backend)
+    stem_names = [pathlib.PurePath(name).stem for name in backend.list(path_directory)]
+    return analyze_stem_names(stem_names)
+
+
+def analyze_stem_names(stem_names):
+    """Given the stem names of files in a directory, determine if they match some 
+        sort of formatting pattern.
+
+    Args:
+        stem_names (list): the file names (without suffixes) to analyze against.
+
+    Returns:
+        dict: the same information object that analyze_directory() returns.
+    """
+
     return_object = {
         "detected_formatting": False,
         "formatting_type": None,
         "formatting_separator": None,
     }
-    
-    path_directory = process_directory_location(directory)
-    files = path_directory.iterdir()
-    stem_names = [f.stem for f in files]
 
     # no file names were found in the directory, don't process for patterns
     if not stem_names:
@@ -353,4 +641,4 @@ def analyze_directory(directory):
             "formatting_separator": split_common_char,
         }
 
-    return return_object
\ No newline at end of file
+    return return_object
@@ -0,0 +1,204 @@
+"""
+    Keep an append-only checkpoint journal for batch copies so an interrupted
+    run (Ctrl-C, a sync conflict, a full disk) can be resumed. The first line of
+    the journal records the plan of the batch, and every copy appends a line
+    when it begins and another once it finishes, each as a JSON object. Resuming
+    skips every target the journal marks as copied without listing or statting
+    it again, settles the one target that began without finishing, and a half
+    written last line (from a crash mid-append) is discarded and truncated away.
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import hashlib
+import json
+import pathlib
+
+
+class BatchJournal:
+    """Append-only journal of the plan and finished targets of one batch copy.
+
+    Args:
+        journal_file (str or path-like object): the journal file to write.
+        resume (bool, optional): continue from an existing journal for the same
+            plan instead of starting a new one, and defaults to False.
+    """
+
+    def __init__(self, journal_file, resume=False):
+        self.journal_file = pathlib.Path(journal_file)
+        self.resume_requested = resume
+        self.plan = None
+        self.completed = bytearray()
+        self.in_flight = set()
+        self.handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def resume(self, plan):
+        """Load the journal of an earlier run of plan so the batch can continue from it.
+
+        Args:
+            plan (dict): the JSON-serializable plan the batch is about to run.
+
+        Raises:
+            ValueError: if the journal records a different plan.
+
+        Returns:
+            dict: the recorded plan (including anything start() was given beyond plan),
+                or None when resuming was not requested or there is nothing to resume.
+        """
+
+        if not self.resume_requested or not self.journal_file.exists():
+            return None
+        entries, good_offset = read_journal_entries(self.journal_file)
+        if not entries or "plan" not in entries[0]:
+            return None
+
+        recorded_plan = entries[0]["plan"]
+        if any(recorded_plan.get(key) != value for key, value in plan.items()):
+            raise ValueError(f"Journal {self.journal_file} records a different batch: {recorded_plan}")
+
+        # failed targets are retried on every resume, so a target cut off half way through
+        # its copy can be anywhere in the batch: it is any target that began without finishing
+        self.in_flight = set()
+        for entry in entries[1:]:
+            if "begin" in entry:
+                self.in_flight.add(entry["begin"])
+                continue
+            self.in_flight.discard(entry["index"])
+            if entry["succeeded"]:
+                self.mark_completed(entry["index"])
+
+        # drop a half written last entry before appending after it
+        with open(self.journal_file, "r+b") as f:
+            f.truncate(good_offset)
+        self.handle = open(self.journal_file, "a", encoding="utf-8")
+        self.plan = recorded_plan
+        return recorded_plan
+
+    def start(self, plan):
+        """Start a new journal for plan, replacing any journal already at the file.
+
+        Args:
+            plan (dict): the JSON-serializable plan of the batch.
+        """
+
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = open(self.journal_file, "w", encoding="utf-8")
+        self.plan = plan
+        self.completed = bytearray()
+        self.in_flight = set()
+        self.append({"plan": plan})
+
+    def begin(self, index):
+        """Checkpoint that the copy of target index is about to write its target, so an
+            interruption part way through the write can be found on resume.
+
+        Args:
+            index (int): the index of the target within the batch.
+        """
+
+        self.append({"begin": index})
+
+    def record(self, index, succeeded):
+        """Checkpoint the outcome of the copy of target index.
+
+        Args:
+            index (int): the index of the target within the batch.
+            succeeded (bool): wether the copy succeeded.
+        """
+
+        if succeeded:
+            self.mark_completed(index)
+        self.append({"index": index, "succeeded": bool(succeeded)})
+
+    def is_completed(self, index):
+        """Check if the journal records the copy of target index as done.
+
+        Args:
+            index (int): the index of the target within the batch.
+
+        Returns:
+            bool: wether target index was already copied.
+        """
+
+        return index < len(self.completed) and self.completed[index] == 1
+
+    def mark_completed(self, index):
+        """Mark target index as copied in the compact completed flags (one byte per target).
+
+        Args:
+            index (int): the index of the target within the batch.
+        """
+
+        if index >= len(self.completed):
+            self.completed.extend(bytes(index + 1 - len(self.completed)))
+        self.completed[index] = 1
+
+    def append(self, entry):
+        """Append a single JSON entry line to the journal and flush it to the OS.
+
+        Args:
+            entry (dict): the JSON-serializable entry to append.
+        """
+
+        self.handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.handle.flush()
+
+    def close(self):
+        """Close the journal file, keeping it on disk for a later resume."""
+
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def remove(self):
+        """Close and delete the journal once its batch has fully succeeded."""
+
+        self.close()
+        self.journal_file.unlink(missing_ok=True)
+
+
+def read_journal_entries(journal_file):
+    """Read every complete entry of a journal file, stopping at the first line that
+        was only partly written.
+
+    Args:
+        journal_file (pathlib.Path): the journal file to read.
+
+    Returns:
+        tuple: two elements, the list of decoded entries and the byte offset just
+            after the last complete entry.
+    """
+
+    entries, good_offset = [], 0
+    with open(journal_file, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+            good_offset += len(line)
+    return entries, good_offset
+
+
+def journal_name(*plan_parts):
+    """Build a stable journal file name for a batch from the parts that identify it.
+
+    Args:
+        *plan_parts: the values identifying the batch (such as template, destination, count).
+
+    Returns:
+        str: the journal file name.
+    """
+
+    digest = hashlib.sha1("\0".join(str(part) for part in plan_parts).encode(), usedforsecurity=False)
+    return f"batch-{digest.hexdigest()[:16]}.jsonl"
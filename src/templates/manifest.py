@@ -0,0 +1,234 @@
+"""
+    Run many recurring template copy jobs from a single TOML manifest. Every
+    template is read once and every destination is listed and analyzed once no
+    matter how many jobs use them, and the jobs run on a scheduler that limits
+    how many destinations on the same device are written to at the same time.
+
+    An example manifest (relative paths are relative to the manifest file):
+
+        [scheduler]
+        device_concurrency = 2
+
+        [defaults]
+        use_formatting = true
+
+        [[jobs]]
+        name = "weekly review"
+        template = "templates/weekly-review.md"
+        destination = "reviews"
+
+        [[jobs]]
+        name = "project dailies"
+        template = "templates/daily.md"
+        destination = "projects/dailys"
+        start = 2025-01-06
+        end = 2025-01-10
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import collections
+import concurrent.futures
+import datetime
+import pathlib
+import tomllib
+from templates import template_copier as tc
+from templates import backends
+from templates import results as cr
+
+# the keys a job table in the manifest may contain
+JOB_KEYS = {"name", "template", "destination", "count", "start", "end", "use_formatting"}
+
+
+def load_manifest(manifest_file):
+    """Load and validate a TOML manifest of template copy jobs.
+
+    Args:
+        manifest_file (str or path-like object): the manifest file to load.
+
+    Raises:
+        FileNotFoundError: if the manifest file does not exist.
+        ValueError: if the manifest is not valid TOML or a job is malformed.
+
+    Returns:
+        dict: the manifest with a "device_concurrency" int and a "jobs" list of
+            normalized job dicts that run_manifest() accepts.
+    """
+
+    manifest_path = pathlib.Path(manifest_file)
+    try:
+        with open(manifest_path, "rb") as f:
+            manifest = tomllib.load(f)
+    except tomllib.TOMLDecodeError as tde:
+        raise ValueError(f"Manifest is not valid TOML: {tde}")
+
+    scheduler, defaults = manifest.get("scheduler", {}), manifest.get("defaults", {})
+    for table_name, table in [("scheduler", scheduler), ("defaults", defaults)]:
+        if not isinstance(table, dict):
+            raise ValueError(f"Manifest {table_name} should be a [{table_name}] table: {table}")
+    device_concurrency = scheduler.get("device_concurrency", 1)
+    # TOML booleans are Python bools, which are ints too
+    if not isinstance(device_concurrency, int) or isinstance(device_concurrency, bool) or device_concurrency < 1:
+        raise ValueError(f"Scheduler device_concurrency must be a positive integer: {device_concurrency}")
+
+    jobs = manifest.get("jobs", [])
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        raise ValueError(f"Manifest jobs should be [[jobs]] tables: {jobs}")
+    if not jobs:
+        raise ValueError(f"Manifest does not define any [[jobs]]: {manifest_file}")
+    return {
+        "device_concurrency": device_concurrency,
+        "jobs": [process_manifest_job(job, index, defaults, manifest_path.parent) for index, job in enumerate(jobs)],
+    }
+
+
+def process_manifest_job(job, index, defaults, base_directory):
+    """Validate a single job table from a manifest and fill in its defaults.
+
+    Args:
+        job (dict): the job table as parsed from the manifest.
+        index (int): the position of the job within the manifest.
+        defaults (dict): the [defaults] table of the manifest.
+        base_directory (pathlib.Path): the directory relative paths are relative to.
+
+    Raises:
+        ValueError: if the job is missing keys, has unknown keys, or mixes a count
+            with a date range.
+
+    Returns:
+        dict: the normalized job.
+    """
+
+    job = {**defaults, **job}
+    name = job.get("name", f"job {index + 1}")
+    unknown_keys = set(job) - JOB_KEYS
+    if unknown_keys:
+        raise ValueError(f"Manifest job '{name}' has unknown keys: {', '.join(sorted(unknown_keys))}")
+    for required_key in ["template", "destination"]:
+        if required_key not in job:
+            raise ValueError(f"Manifest job '{name}' is missing '{required_key}'")
+        if not isinstance(job[required_key], str):
+            raise ValueError(f"Manifest job '{name}' {required_key} must be a path string: {job[required_key]}")
+    if not isinstance(job.get("use_formatting", True), bool):
+        raise ValueError(f"Manifest job '{name}' use_formatting must be true or false: {job['use_formatting']}")
+
+    start_date, end_date = job.get("start"), job.get("end")
+    if (start_date is None) != (end_date is None):
+        raise ValueError(f"Manifest job '{name}' needs both a start and end date")
+    if start_date is not None and "count" in job:
+        raise ValueError(f"Manifest job '{name}' cannot have both a count and a date range")
+    for date in [start_date, end_date]:
+        if date is not None and (not isinstance(date, datetime.date) or isinstance(date, datetime.datetime)):
+            raise ValueError(f"Manifest job '{name}' dates must be TOML dates (YYYY-MM-DD): {date}")
+    count = job.get("count", 1)
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ValueError(f"Manifest job '{name}' count must be a non-negative integer: {count}")
+
+    return {
+        "name": name,
+        "template": base_directory / job["template"],
+        "destination": base_directory / job["destination"],
+        "count": count,
+        "start": start_date,
+        "end": end_date,
+        "use_formatting": job.get("use_formatting", True),
+    }
+
+
+def run_manifest(jobs, device_concurrency=1, backend=None):
+    """Run manifest jobs, sharing template reads and directory snapshots between them.
+        Jobs copying into the same destination run one after another, at most
+        device_concurrency destinations on the same device are written concurrently,
+        and destinations on different devices are written independently of each other.
+
+    Args:
+        jobs (list): the normalized job dicts, as returned by load_manifest().
+        device_concurrency (int, optional): the maximum number of destinations on one
+            device that are written to at the same time, and defaults to 1.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to
+            copy within, and defaults to the local disk.
+
+    Returns:
+        list: a summary dict for every job in order, holding its "name", its "results"
+            as a results.CopyResults, and an "error" message for jobs that could not run.
+    """
+
+    backend = backends.use_backend(backend)
+    summaries = [{"name": job["name"], "results": cr.CopyResults(), "error": None} for job in jobs]
+    templates, destinations = {}, {}
+    destination_jobs = collections.defaultdict(list)
+    for index, job in enumerate(jobs):
+        try: # load every template and destination once, no matter how many jobs use it
+            template = load_shared(templates, tc.TemplateSource, job["template"], backend)
+            destination = load_shared(destinations, tc.DestinationSnapshot, job["destination"], backend)
+        except OSError as error:
+            summaries[index]["error"] = str(error)
+            continue
+        destination_jobs[destination.path].append((index, job, template, destination))
+
+    device_groups = collections.defaultdict(list)
+    for job_group in destination_jobs.values():
+        device_groups[job_group[0][3].device].append(job_group)
+
+    # every device gets its own workers pulling from its own queue of destinations, so
+    # a device with many destinations never holds up the destinations of an idle device
+    executors = {
+        device: concurrent.futures.ThreadPoolExecutor(max_workers=min(device_concurrency, len(groups)))
+        for device, groups in device_groups.items()
+    }
+    try:
+        futures = [
+            executors[device].submit(run_job_group, job_group, summaries, backend)
+            for device, groups in device_groups.items()
+            for job_group in groups
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        for executor in executors.values():
+            executor.shutdown()
+    return summaries
+
+
+def load_shared(loaded, loader, path_object, backend):
+    """Get the object loader creates for path_object, creating it only the first time
+        the resolved path is requested.
+
+    Args:
+        loaded (dict): the already loaded objects keyed by resolved path.
+        loader (type): tc.TemplateSource or tc.DestinationSnapshot.
+        path_object (str or path-like object): the path to load.
+        backend (backends.FilesystemBackend): the filesystem backend to load through.
+
+    Returns:
+        object: the shared loaded object for the path.
+    """
+
+    resolved_path = backend.resolve(path_object)
+    if resolved_path not in loaded:
+        loaded[resolved_path] = loader(path_object, backend)
+    return loaded[resolved_path]
+
+
+def run_job_group(job_group, summaries, backend):
+    """Run the jobs that copy into one destination in order.
+
+    Args:
+        job_group (list): (index, job, template, destination) tuples for one destination.
+        summaries (list): the job summaries to record results and errors into.
+        backend (backends.FilesystemBackend): the filesystem backend to copy within.
+    """
+
+    for index, job, template, destination in job_group:
+        copier = tc.TemplateCopier(template, destination, use_formatting=job["use_formatting"], backend=backend)
+        try:
+            if job["start"] is not None:
+                summaries[index]["results"] = copier.copy_dates(job["start"], job["end"])
+            elif job["count"] == 1:
+                summaries[index]["results"].record(0, copier.copy)
+            else:
+                summaries[index]["results"] = copier.copy_many(job["count"])
+        except (OSError, ValueError) as error:
+            summaries[index]["error"] = str(error)
@@ -0,0 +1,226 @@
+"""
+    Record the outcome of every copy in a batch compactly. Instead of a list of
+    bools, batches return a CopyResults container that keeps a status code,
+    errno, target index, and duration per copy in typed arrays (about eleven
+    bytes per copy, plus the exception name of any failure without an errno),
+    so even million-copy batches can report which copies failed and why,
+    summarize themselves, and be exported as JSON.
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import array
+import collections
+import errno as errno_codes
+import json
+import os
+import time
+
+# the status codes a copy can finish with
+SUCCEEDED = 0
+FAILED = 1
+EXISTS = 2
+IS_DIRECTORY = 3
+
+STATUS_NAMES = {
+    SUCCEEDED: "succeeded",
+    FAILED: "failed",
+    EXISTS: "exists",
+    IS_DIRECTORY: "is_directory",
+}
+
+# the error numbers recorded for errors raised without one
+DEFAULT_ERRNOS = {
+    EXISTS: errno_codes.EEXIST,
+    IS_DIRECTORY: errno_codes.EISDIR,
+}
+
+# a single copy outcome as returned when iterating over failures
+CopyRecord = collections.namedtuple("CopyRecord", ["index", "status", "errno", "seconds", "exception"], defaults=[None])
+
+
+def status_for_error(error):
+    """Get the status code a copy that raised error finished with.
+
+    Args:
+        error (OSError): the error the copy raised.
+
+    Returns:
+        int: the status code for the error.
+    """
+
+    if isinstance(error, FileExistsError):
+        return EXISTS
+    if isinstance(error, IsADirectoryError):
+        return IS_DIRECTORY
+    return FAILED
+
+
+class CopyResults:
+    """Array-backed outcomes of a batch of copies. Iterating over the container yields
+        wether each copy succeeded, so all(results) and sum(results) keep working.
+    """
+
+    __slots__ = ("statuses", "errnos", "indexes", "durations", "exceptions")
+
+    def __init__(self):
+        self.statuses = array.array("B")
+        self.errnos = array.array("H")
+        self.indexes = array.array("I")
+        self.durations = array.array("f")
+        # the exception class names of failures without an errno, keyed by position
+        self.exceptions = {}
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def __iter__(self):
+        return (status == SUCCEEDED for status in self.statuses)
+
+    def __getitem__(self, position):
+        return self.statuses[position] == SUCCEEDED
+
+    def __repr__(self):
+        return f"CopyResults({self.counts()})"
+
+    def append(self, index, status, errno=0, seconds=0.0):
+        """Record the outcome of the copy of target index.
+
+        Args:
+            index (int): the index of the copy's target within its batch.
+            status (int): the status code the copy finished with.
+            errno (int, optional): the error number the copy failed with.
+            seconds (float, optional): how long the copy took.
+        """
+
+        self.statuses.append(status)
+        self.errnos.append(errno)
+        self.indexes.append(index)
+        self.durations.append(seconds)
+
+    def record(self, index, copy_call):
+        """Run and time copy_call, recording its outcome for target index. The call
+            fails by returning False or raising an exception, which is recorded instead
+            of propagating so one bad target never aborts the rest of its batch. Only
+            interruptions such as KeyboardInterrupt propagate.
+
+        Args:
+            index (int): the index of the copy's target within its batch.
+            copy_call (callable): the copy to run, taking no arguments.
+
+        Returns:
+            bool: wether the copy succeeded or not.
+        """
+
+        started, exception = time.perf_counter(), None
+        try:
+            status, errno = (SUCCEEDED if copy_call() else FAILED), 0
+        except OSError as error:
+            status = status_for_error(error)
+            errno = error.errno or DEFAULT_ERRNOS.get(status, 0)
+        except Exception as error:
+            # a bad target (such as one outside an archive's root) or a backend bug has no
+            # errno, so keep the kind of error to tell them apart
+            status, errno, exception = FAILED, 0, type(error).__name__
+        self.append(index, status, errno, time.perf_counter() - started)
+        if exception is not None:
+            self.exceptions[len(self) - 1] = exception
+        return status == SUCCEEDED
+
+    def extend(self, other):
+        """Append every outcome recorded in another CopyResults.
+
+        Args:
+            other (CopyResults): the results to append.
+        """
+
+        offset = len(self)
+        self.exceptions.update((offset + position, name) for position, name in other.exceptions.items())
+        self.statuses.extend(other.statuses)
+        self.errnos.extend(other.errnos)
+        self.indexes.extend(other.indexes)
+        self.durations.extend(other.durations)
+
+    def record_at(self, position):
+        """Get the full outcome recorded at position.
+
+        Args:
+            position (int): the position of the outcome within the container.
+
+        Returns:
+            CopyRecord: the index, status, errno, seconds, and exception class name (for 
+                failures without an errno) of the copy.
+        """
+
+        position = range(len(self))[position]
+        return CopyRecord(
+            self.indexes[position], self.statuses[position], self.errnos[position], self.durations[position],
+            self.exceptions.get(position),
+        )
+
+    def failures(self):
+        """Iterate over the outcomes of every copy that did not succeed.
+
+        Returns:
+            iterator: the CopyRecord of every failed copy, in order.
+        """
+
+        return (self.record_at(position) for position, status in enumerate(self.statuses) if status != SUCCEEDED)
+
+    @property
+    def succeeded(self):
+        return self.statuses.count(SUCCEEDED)
+
+    @property
+    def failed(self):
+        return len(self) - self.succeeded
+
+    def counts(self):
+        """Count the copies that finished with each status.
+
+        Returns:
+            dict: the number of copies keyed by status name, for statuses that occurred.
+        """
+
+        status_counts = collections.Counter(self.statuses)
+        return {STATUS_NAMES[status]: count for status, count in sorted(status_counts.items())}
+
+    def summary(self):
+        """Summarize the batch.
+
+        Returns:
+            dict: the total, succeeded, and failed copy counts, the per status counts,
+                and the total seconds spent copying.
+        """
+
+        return {
+            "total": len(self),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "statuses": self.counts(),
+            "seconds": round(sum(self.durations), 6),
+        }
+
+    def to_json(self, **json_options):
+        """Export the summary and every failure of the batch as JSON.
+
+        Args:
+            **json_options: keyword arguments passed on to json.dumps().
+
+        Returns:
+            str: the JSON object with "summary" and "failures" members.
+        """
+
+        failures = [
+            {
+                "index": failure.index,
+                "status": STATUS_NAMES[failure.status],
+                "errno": failure.errno,
+                "error": os.strerror(failure.errno) if failure.errno else failure.exception,
+                "seconds": round(failure.seconds, 6),
+            }
+            for failure in self.failures()
+        ]
+        return json.dumps({"summary": self.summary(), "failures": failures}, **json_options)
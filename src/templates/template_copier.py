@@ -0,0 +1,220 @@
+"""
+    Provide a reusable session object for library users that copy the same 
+    template into the same directory many times. The copier resolves and reads 
+    the template once, snapshots the target directory once, and analyzes its 
+    formatting once, so repeated copies only pay for the write itself. Call 
+    refresh() whenever the template or target directory changes outside of 
+    the copier. The loaded template and directory snapshot are separate objects 
+    so several copiers (such as the jobs of a manifest) can share them.
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import pathlib
+from templates import copy_template as ct
+from templates import backends
+from templates import results as cr
+
+
+class TemplateSource:
+    """A resolved template file together with its permission bits and, unless it is 
+        large enough to be streamed, its contents.
+
+    Args:
+        template_object (str or path-like object): the template file to load.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            load the template through, and defaults to the local disk.
+    """
+
+    def __init__(self, template_object, backend=None):
+        self.backend = backends.use_backend(backend)
+        self.template_object = template_object
+        self.refresh()
+
+    def refresh(self):
+        """Resolve, stat, and read the template again from the backend."""
+
+        self.path = ct.process_template_location(self.template_object, backend=self.backend)
+        template_stat = self.backend.stat(self.path)
+        self.mode = template_stat.mode
+        # large templates are streamed through the backend on every copy instead of held in memory
+        self.data = None
+        if template_stat.size <= backends.STREAM_THRESHOLD:
+            self.data = self.backend.read_bytes(self.path)
+
+
+class DestinationSnapshot:
+    """A resolved target directory together with the names it contained when it was 
+        last listed (plus everything copied into it since) and its formatting analysis.
+
+    Args:
+        target_directory (str or path-like object): the directory to snapshot.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            list the directory through, and defaults to the local disk.
+    """
+
+    def __init__(self, target_directory, backend=None):
+        self.backend = backends.use_backend(backend)
+        self.target_directory = target_directory
+        self.refresh()
+
+    def refresh(self):
+        """List and analyze the target directory again from the backend."""
+
+        self.path = ct.process_directory_location(self.target_directory, backend=self.backend)
+        self.device = self.backend.stat(self.path).device
+        self.entries = set(self.backend.list(self.path))
+        stem_names = [pathlib.PurePath(name).stem for name in self.entries]
+        self.analyze_results = ct.analyze_stem_names(stem_names)
+
+
+class TemplateCopier:
+    """Session that holds a resolved template, its contents, a snapshot of the 
+        target directory, and the directory analysis between copies.
+
+    Args:
+        template (str, path-like object, or TemplateSource): the template file to 
+            copy from, or an already loaded template to share.
+        destination (str, path-like object, or DestinationSnapshot): the directory 
+            to copy into, or an already taken snapshot to share.
+        use_formatting (bool, optional): optionally follow formatting present in 
+            the destination, and defaults to True.
+        progress_callback (callable, optional): progress reporter used when the 
+            template is large enough to be streamed.
+        backend (backends.FilesystemBackend, optional): the filesystem backend to 
+            copy within, and defaults to the local disk.
+    """
+
+    def __init__(self, template, destination, use_formatting=True, progress_callback=None, backend=None):
+        self.backend = backends.use_backend(backend)
+        self.use_formatting = use_formatting
+        self.progress_callback = progress_callback
+        if not isinstance(template, TemplateSource):
+            template = TemplateSource(template, self.backend)
+        if not isinstance(destination, DestinationSnapshot):
+            destination = DestinationSnapshot(destination, self.backend)
+        self.template = template
+        self.destination = destination
+
+    def refresh(self):
+        """Invalidate everything the copier holds and load it again from the backend: the 
+            resolved template and its contents, the target directory snapshot, and 
+            the directory analysis results.
+        """
+
+        self.template.refresh()
+        self.destination.refresh()
+
+    def copy(self, target_name=None):
+        """Copy the template once into the target directory. A copy fails the same way 
+            it does within copy_many() and copy_dates(): any exception from the backend 
+            (an OSError or not, such as the ValueError of a target outside an archive 
+            root) is an unsuccessful copy, and only interruptions such as 
+            KeyboardInterrupt propagate. Collisions are raised so callers can tell them 
+            apart, just as batch results record them with their own status.
+
+        Args:
+            target_name (str, optional): the file name to copy into, and defaults to 
+                the name copy_template_single() would choose from the held analysis.
+
+        Raises:
+            FileExistsError: if the target file already exists in the snapshot
+            IsADirectoryError: if the target file is a directory in the snapshot
+
+        Returns:
+            bool: wether the copy succeeded or not.
+        """
+
+        if target_name is None:
+            analyze_results = self.destination.analyze_results
+            target_name = ct.single_target_name(self.template.path, analyze_results, self.use_formatting)
+        try: # collisions are raised, any other failure is reported as an unsuccessful copy
+            return self.copy_handler(target_name)
+        except (FileExistsError, IsADirectoryError):
+            raise
+        except Exception:
+            return False
+
+    def copy_many(self, number_copies=1):
+        """Copy the template number_copies times into the target directory using the 
+            same names copy_template_multiple() would use.
+
+        Args:
+            number_copies (int): the number of copies to make of the template.
+
+        Raises:
+            ValueError: if the number of copies is some un-copiable (less than zero) number.
+
+        Returns:
+            results.CopyResults: the status, errno, index, and timing of every copy.
+        """
+
+        if number_copies < 0: # cannot copy less than zero times
+            raise ValueError(f"Cannot copy notes {number_copies} of times")
+
+        results = cr.CopyResults()
+        for index in range(0, number_copies):
+            target_name = ct.multiple_target_name(self.template.path, index)
+            results.record(index, lambda: self.copy_handler(target_name))
+        return results
+
+    def copy_dates(self, start_date, end_date):
+        """Copy the template once for every date from start_date through end_date using 
+            the same names copy_template_date_range() would use.
+
+        Args:
+            start_date (datetime.date): the first date to make a copy for.
+            end_date (datetime.date): the last date to make a copy for.
+
+        Raises:
+            ValueError: if end_date comes before start_date.
+
+        Returns:
+            results.CopyResults: the status, errno, index, and timing of every copy.
+        """
+
+        analyze_results = self.destination.analyze_results
+        results = cr.CopyResults()
+        for index, date in enumerate(ct.date_range(start_date, end_date)):
+            target_name = ct.date_target_name(self.template.path, date, analyze_results, self.use_formatting)
+            results.record(index, lambda: self.copy_handler(target_name))
+        return results
+
+    def copy_handler(self, target_name):
+        """Write the held template into target_name, checking the directory snapshot 
+            instead of the filesystem for existing entries.
+
+        Args:
+            target_name (str): the file name within the target directory to copy into.
+
+        Raises:
+            FileExistsError: if the target file already exists in the snapshot
+            IsADirectoryError: if the target file is a directory in the snapshot
+            OSError: if the backend failed to write the target file
+
+        Returns:
+            bool: True once the copy succeeded.
+        """
+
+        entries = self.destination.entries
+        target_file = self.destination.path.joinpath(target_name)
+        if target_name in entries:
+            # only collisions pay for a stat, to tell directories and files apart
+            target_stat = self.backend.stat(target_file)
+            if target_stat is not None and target_stat.is_dir:
+                raise IsADirectoryError(f"Target file is a directory: {target_file}")
+            raise FileExistsError(f"Target file already exists: {target_file}")
+
+        try: # attempt to write the held template into the target
+            if self.template.data is None:
+                self.backend.copy(self.template.path, target_file, self.progress_callback)
+            else:
+                self.backend.write(target_file, [self.template.data], self.template.mode)
+        except FileExistsError:
+            # created outside the copier since the last refresh, remember it now
+            entries.add(target_name)
+            raise
+        entries.add(target_name)
+        return True
@@ -0,0 +1,187 @@
+"""
+    Pace bulk copies so they don't flood the file watcher of a running Obsidian
+    application and its sync plugin. A Throttle spaces copies out to a target
+    files per second and/or bytes per second, and an AdaptiveThrottle also backs
+    off whenever the observed write latency climbs above its running baseline,
+    recovering towards the target rate once writes are quick again. Both keep
+    track of the effective throughput for the run summary.
+
+    Author: Jason Boyd
+    Date: October 19, 2026
+    Modified: October 19, 2026
+"""
+
+import re
+import time
+
+# multipliers of the byte units accepted by parse_rate()
+BYTE_UNITS = {"b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3}
+
+
+def parse_rate(rate_string):
+    """Parse a rate given on the command line, either a number of files per second
+        ("20", "20/s") or an amount of bytes per second ("512KB", "4MB/s").
+
+    Args:
+        rate_string (str): the rate to parse.
+
+    Raises:
+        ValueError: if the rate is not a positive number of files or bytes per second.
+
+    Returns:
+        tuple: two elements, the files per second and the bytes per second, where
+            the rate that was not given is None.
+    """
+
+    rate_match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmg]?b)?\s*(?:/s)?\s*", rate_string.lower())
+    if rate_match is None or float(rate_match.group(1)) <= 0:
+        raise ValueError(f"Rate should be a positive files/s (20) or bytes/s (4MB) value: {rate_string}")
+    amount, unit = float(rate_match.group(1)), rate_match.group(2)
+    if unit is None:
+        return (amount, None)
+    return (None, amount * BYTE_UNITS[unit])
+
+
+class Throttle:
+    """Space copies out to at most files_per_second and bytes_per_second.
+
+    Args:
+        files_per_second (float, optional): the maximum number of copies per second.
+        bytes_per_second (float, optional): the maximum number of bytes written per second.
+        clock (callable, optional): the monotonic clock, and defaults to time.monotonic.
+        sleep (callable, optional): the sleep function, and defaults to time.sleep.
+    """
+
+    def __init__(self, files_per_second=None, bytes_per_second=None, clock=time.monotonic, sleep=time.sleep):
+        self.files_per_second = files_per_second
+        self.bytes_per_second = bytes_per_second
+        self.clock = clock
+        self.sleep = sleep
+        self.started = None
+        self.finished = None
+        self.next_copy = None
+        self.copy_started = None
+        self.files = 0
+        self.bytes = 0
+        self.waited = 0.0
+
+    def copy_interval(self, bytes_written):
+        """Get how long a copy of bytes_written bytes should take at the target rates.
+
+        Args:
+            bytes_written (int): the number of bytes the copy wrote.
+
+        Returns:
+            float: the number of seconds to leave between the start of this copy and the next.
+        """
+
+        file_interval = 1 / self.files_per_second if self.files_per_second else 0.0
+        byte_interval = bytes_written / self.bytes_per_second if self.bytes_per_second else 0.0
+        return max(file_interval, byte_interval)
+
+    def before_copy(self):
+        """Wait until the next copy is allowed to start."""
+
+        now = self.clock()
+        if self.started is None:
+            self.started = self.next_copy = now
+        if self.next_copy > now:
+            self.sleep(self.next_copy - now)
+            self.waited += self.next_copy - now
+            now = self.next_copy
+        self.copy_started = now
+
+    def after_copy(self, bytes_written, seconds):
+        """Account for a finished copy and schedule when the next one may start.
+
+        Args:
+            bytes_written (int): the number of bytes the copy wrote.
+            seconds (float): how long the copy took to write.
+        """
+
+        self.files += 1
+        self.bytes += bytes_written
+        self.finished = self.clock()
+        self.next_copy = self.copy_started + self.copy_interval(bytes_written)
+
+    def summary(self):
+        """Summarize the effective throughput of every copy made through the throttle.
+
+        Returns:
+            dict: the files and bytes copied, the elapsed and waited seconds, and the
+                effective files and bytes per second.
+        """
+
+        elapsed = (self.finished - self.started) if self.files else 0.0
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "seconds": round(elapsed, 6),
+            "waited": round(self.waited, 6),
+            "files_per_second": self.files / elapsed if elapsed > 0 else 0.0,
+            "bytes_per_second": self.bytes / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+class AdaptiveThrottle(Throttle):
+    """Throttle that also backs off when write latency climbs. Every copy's latency is
+        compared to a slowly moving baseline; when the recent latency rises above
+        latency_factor times the baseline the spacing between copies is doubled, and
+        otherwise it shrinks back towards the spacing of the target rates.
+
+    Args:
+        files_per_second (float, optional): the maximum number of copies per second,
+            and unlimited (only latency based backoff) when not given.
+        bytes_per_second (float, optional): the maximum number of bytes written per second.
+        latency_factor (float, optional): how far above the baseline the recent latency
+            may climb before backing off, and defaults to 2.0.
+        min_files_per_second (float, optional): the slowest rate backing off may reach,
+            and defaults to 1.0.
+        clock (callable, optional): the monotonic clock, and defaults to time.monotonic.
+        sleep (callable, optional): the sleep function, and defaults to time.sleep.
+    """
+
+    # smoothing of the slow baseline and fast recent latency averages
+    BASELINE_WEIGHT = 0.02
+    RECENT_WEIGHT = 0.3
+
+    # the spacing backing off starts from when copies are not spaced out at all
+    INITIAL_BACKOFF = 0.001
+
+    # latencies below this many seconds are treated as noise rather than congestion
+    LATENCY_FLOOR = 0.0001
+
+    def __init__(
+        self, files_per_second=None, bytes_per_second=None, latency_factor=2.0, min_files_per_second=1.0,
+        clock=time.monotonic, sleep=time.sleep,
+    ):
+        super().__init__(files_per_second, bytes_per_second, clock, sleep)
+        self.latency_factor = latency_factor
+        self.max_backoff = 1 / min_files_per_second
+        self.baseline_latency = None
+        self.recent_latency = None
+        self.backoff = 0.0
+        self.backoffs = 0
+
+    def after_copy(self, bytes_written, seconds):
+        super().after_copy(bytes_written, seconds)
+        if self.baseline_latency is None:
+            self.baseline_latency = self.recent_latency = seconds
+        self.recent_latency += self.RECENT_WEIGHT * (seconds - self.recent_latency)
+
+        if self.recent_latency > self.latency_factor * max(self.baseline_latency, self.LATENCY_FLOOR):
+            # writes are slowing down, back off multiplicatively
+            self.backoff = min(max(self.backoff * 2, self.INITIAL_BACKOFF), self.max_backoff)
+            self.backoffs += 1
+        else:
+            # only learn the baseline from uncongested writes so it can't creep upwards
+            self.baseline_latency += self.BASELINE_WEIGHT * (seconds - self.baseline_latency)
+            self.backoff = self.backoff * 0.9 if self.backoff > self.INITIAL_BACKOFF else 0.0
+
+        target_interval = self.copy_interval(bytes_written)
+        self.next_copy = self.copy_started + max(target_interval, self.backoff)
+
+    def summary(self):
+        run_summary = super().summary()
+        run_summary["backoffs"] = self.backoffs
+        return run_summary
@@ -0,0 +1,151 @@
+from templates import backends
+import pytest
+import errno
+import tarfile
+import zipfile
+
+class TestBackends:
+
+    def test_stream_template_copy(self, tmp_path, monkeypatch):
+        template_file = tmp_path / "template_file.canvas"
+        template_file.write_bytes(bytes(range(256)) * 100)
+        progress = []
+        callback = lambda copied, total, rate: progress.append((copied, total))
+
+        sendfile_target = tmp_path / "sendfile_target.canvas"
+        copied = backends.stream_template_copy(template_file, sendfile_target, 4096, callback)
+        assert copied == 25600
+        assert sendfile_target.read_bytes() == template_file.read_bytes()
+        assert progress[-1] == (25600, 25600)
+        assert len(progress) == 7
+
+        monkeypatch.delattr(backends.os, "sendfile", raising=False)
+        mmap_target = tmp_path / "mmap_target.canvas"
+        assert backends.stream_template_copy(template_file, mmap_target, 1000) == 25600
+        assert mmap_target.read_bytes() == template_file.read_bytes()
+
+        empty_file = tmp_path / "empty_file.canvas"
+        empty_file.touch()
+        assert backends.stream_template_copy(empty_file, tmp_path / "empty_target.canvas") == 0
+        with pytest.raises(FileExistsError):
+            backends.stream_template_copy(template_file, mmap_target)
+
+
+    def test_local_backend(self, tmp_path):
+        local = backends.LocalBackend()
+        notes_dir = local.resolve(tmp_path / "vault" / "notes")
+        assert local.stat(notes_dir) is None
+        local.create(notes_dir)
+        local.create(notes_dir)
+        assert local.stat(notes_dir).is_dir
+
+        note_file = notes_dir / "note.md"
+        local.write(note_file, [b"# ", b"note"], 0o600)
+        assert local.stat(note_file) == (True, False, 6, 0o600, local.stat(notes_dir).device)
+        assert local.list(notes_dir) == ["note.md"]
+        assert local.read_bytes(note_file) == b"# note"
+        with pytest.raises(FileExistsError):
+            local.write(note_file, [b"again"])
+
+        def failing_chunks():
+            yield b"partial"
+            raise OSError("disk full")
+        with pytest.raises(OSError):
+            local.write(notes_dir / "partial.md", failing_chunks())
+        assert local.stat(notes_dir / "partial.md") is None
+
+        template_file = notes_dir / "template.md"
+        local.write(template_file, [b"x" * 10000], 0o640)
+        assert local.copy(template_file, notes_dir / "copy.md") == 10000
+        assert local.stat(notes_dir / "copy.md").mode == 0o640
+        with pytest.raises(FileExistsError):
+            local.copy(note_file, notes_dir / "copy.md")
+        assert local.read_bytes(notes_dir / "copy.md") == b"x" * 10000
+
+        read = local.read
+        def full_disk_read(path, chunk_size=backends.STREAM_CHUNK_SIZE):
+            yield next(read(path, 100))
+            raise OSError(errno.ENOSPC, "No space left on device")
+        local.read = full_disk_read
+        with pytest.raises(OSError):
+            local.copy(template_file, notes_dir / "full.md")
+        assert local.stat(notes_dir / "full.md") is None
+
+
+    def test_memory_backend(self):
+        memory = backends.MemoryBackend()
+        notes_dir = memory.resolve("/vault/notes")
+        assert memory.stat(notes_dir) is None
+        with pytest.raises(FileNotFoundError):
+            memory.list(notes_dir)
+        with pytest.raises(FileNotFoundError):
+            memory.write(notes_dir / "note.md", [b"# note"])
+
+        memory.create(notes_dir)
+        assert memory.stat(notes_dir).is_dir
+        assert memory.list(memory.resolve("/vault")) == ["notes"]
+        memory.write(notes_dir / "note.md", [b"# ", b"note"])
+        assert memory.stat(notes_dir / "note.md") == (True, False, 6, 0o644, 0)
+        assert list(memory.read(notes_dir / "note.md", 4)) == [b"# no", b"te"]
+        with pytest.raises(FileExistsError):
+            memory.write(notes_dir / "note.md", [b"again"])
+        with pytest.raises(FileExistsError):
+            memory.create(notes_dir / "note.md")
+        with pytest.raises(IsADirectoryError):
+            memory.read_bytes(notes_dir)
+
+        progress = []
+        callback = lambda copied, total, rate: progress.append((copied, total))
+        assert memory.copy(notes_dir / "note.md", notes_dir / "copy.md", callback) == 6
+        assert memory.read_bytes(notes_dir / "copy.md") == b"# note"
+        assert progress[-1] == (6, 6)
+        assert sorted(memory.list(notes_dir)) == ["copy.md", "note.md"]
+
+
+    def test_archive_backend(self, tmp_path):
+        vault_dir = tmp_path / "vault"
+        (vault_dir / "templates").mkdir(parents=True)
+        (vault_dir / "notes").mkdir()
+        (vault_dir / "notes" / "existing.md").touch()
+        template_file = vault_dir / "templates" / "note.md"
+        template_file.write_bytes(b"# note")
+
+        for archive_name in ["staged.zip", "staged.tar", "staged.tar.gz"]:
+            archive_file = tmp_path / archive_name
+            with backends.ArchiveBackend(archive_file, root=vault_dir) as archive:
+                notes_dir = archive.resolve(vault_dir / "notes")
+                assert sorted(archive.list(notes_dir)) == ["existing.md"]
+                archive.copy(archive.resolve(template_file), notes_dir / "copy.md")
+                archive.create(notes_dir / "weekly")
+                archive.write(notes_dir / "weekly" / "week.md", [b"# week"])
+                assert sorted(archive.list(notes_dir)) == ["copy.md", "existing.md", "weekly"]
+                assert archive.stat(notes_dir / "copy.md").size == 6
+                with pytest.raises(FileExistsError):
+                    archive.write(notes_dir / "existing.md", [b""])
+                with pytest.raises(FileExistsError):
+                    archive.write(notes_dir / "copy.md", [b""])
+                with pytest.raises(FileNotFoundError):
+                    archive.write(notes_dir / "missing" / "note.md", [b""])
+                with pytest.raises(PermissionError):
+                    archive.read_bytes(notes_dir / "copy.md")
+
+            assert not (vault_dir / "notes" / "copy.md").exists()
+            if archive_name.endswith(".zip"):
+                with zipfile.ZipFile(archive_file) as staged:
+                    assert staged.read("notes/copy.md") == b"# note"
+                    assert staged.read("notes/weekly/week.md") == b"# week"
+            else:
+                with tarfile.open(archive_file) as staged:
+                    assert staged.extractfile("notes/copy.md").read() == b"# note"
+                    assert staged.getmember("notes/weekly").isdir()
+
+
+    def test_incomplete_backend(self):
+        class ListOnlyBackend(backends.FilesystemBackend):
+            def list(self, directory):
+                return []
+
+        with pytest.raises(TypeError):
+            ListOnlyBackend()
+        with pytest.raises(TypeError):
+            backends.FilesystemBackend()
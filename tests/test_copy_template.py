@@ -1,4 +1,6 @@
 from templates import copy_template as ct
+from templates import backends
+from templates import results as cr
 import pytest
 import datetime
 
@@ -103,22 +105,36 @@ class TestCopyTemplate:
         assert ct.iso_formatted_list(bad_iso_three, bad_chars_three) == (False, None)
 
 
-    def test_copy_template_handler(self, tmp_path):
+    def test_record_copy_handler(self, tmp_path):
         template_dir = tmp_path / "template_dir"
         template_dir.mkdir()
         template_file = template_dir / "template_file.txt"
         template_file.touch()
+        results = cr.CopyResults()
 
         already_file = tmp_path / "already_file.txt"
         already_file.touch()
-        with pytest.raises(FileExistsError):
-            ct.copy_template_handler(template_file, already_file)
-        with pytest.raises(IsADirectoryError):
-            ct.copy_template_handler(template_file, template_dir)
+        assert ct.record_copy_handler(results, 0, template_file, already_file) == False
+        assert ct.record_copy_handler(results, 1, template_file, template_dir) == False
         good_target_one = tmp_path / "good_target_one.txt"
-        assert ct.copy_template_handler(template_file, good_target_one) == True
+        assert ct.record_copy_handler(results, 2, template_file, good_target_one) == True
         good_target_two = tmp_path / "good_target_two.txt"
-        assert ct.copy_template_handler(template_dir, good_target_two) == False
+        assert ct.record_copy_handler(results, 3, template_dir, good_target_two) == False
+        statuses = [failure.status for failure in results.failures()]
+        assert statuses == [cr.EXISTS, cr.IS_DIRECTORY, cr.IS_DIRECTORY]
+
+
+    def test_record_copy_handler_streaming(self, tmp_path, monkeypatch):
+        template_file = tmp_path / "template_file.canvas"
+        template_file.write_bytes(b"large canvas" * 100)
+        monkeypatch.setattr(backends, "STREAM_THRESHOLD", 64)
+        progress = []
+        callback = lambda copied, total, rate: progress.append(copied)
+
+        target_file = tmp_path / "target_file.canvas"
+        assert ct.record_copy_handler(cr.CopyResults(), 0, template_file, target_file, callback) == True
+        assert target_file.read_bytes() == template_file.read_bytes()
+        assert progress[-1] == 1200
 
 
     def test_copy_template_single(self, tmp_path):
@@ -146,32 +162,92 @@ class TestCopyTemplate:
     def test_copy_template_multiple(self, tmp_path):
         tfo, tdo = self.helper_create_template_structure(tmp_path / "one")
         results_one = ct.copy_template_multiple(tfo, tdo, number_copies=5)
-        assert isinstance(results_one, list)
+        assert isinstance(results_one, cr.CopyResults)
         assert len(results_one) == 5
         assert all(results_one)
 
         tft, tdt = self.helper_create_template_structure(tmp_path / "two")
         results_two = ct.copy_template_multiple(tft, tdt, number_copies=20)
-        assert isinstance(results_two, list)
+        assert isinstance(results_two, cr.CopyResults)
         assert len(results_two) == 20
         assert all(results_two)
 
         tfth, tdth = self.helper_create_template_structure(tmp_path / "three")
         results_three = ct.copy_template_multiple(tfth, tdth, number_copies=0)
-        assert isinstance(results_three, list)
+        assert isinstance(results_three, cr.CopyResults)
         assert len(results_three) == 0
 
+        (tdo / "template_file-copy-5.txt").touch()
+        (tdo / "template_file-copy-7.txt").mkdir()
+        results_four = ct.copy_template_multiple(tfo, tdo, number_copies=8)
+        assert len(results_four) == 8
+        assert results_four.succeeded == 1
+        assert [failure.index for failure in results_four.failures()] == [0, 1, 2, 3, 4, 5, 7]
+        assert results_four.counts() == {"succeeded": 1, "exists": 6, "is_directory": 1}
+
+
+    def test_copy_template_date_range(self, tmp_path):
+        tfo, tdo = self.helper_create_template_structure(tmp_path / "one")
+        start_date, end_date = datetime.date(2025, 1, 30), datetime.date(2025, 2, 2)
+        results_one = ct.copy_template_date_range(tfo, tdo, start_date, end_date)
+        assert len(results_one) == 4
+        assert all(results_one)
+        assert (tdo / "2025-01-30.txt").exists()
+        assert (tdo / "2025-02-02.txt").exists()
+
+        tft, tdt = self.helper_create_template_structure(tmp_path / "two")
+        (tdt / "2025_01_01.txt").touch()
+        assert all(ct.copy_template_date_range(tft, tdt, start_date, start_date))
+        assert (tdt / "2025_01_30.txt").exists()
+        assert all(ct.copy_template_date_range(tft, tdt, end_date, end_date, use_formatting=False))
+        assert (tdt / "2025-02-02.txt").exists()
+        with pytest.raises(ValueError):
+            ct.copy_template_date_range(tft, tdt, end_date, start_date)
+
 
     def test_copy_template(self, tmp_path):
         tfo, tdo = self.helper_create_template_structure(tmp_path)
         with pytest.raises(ValueError):
             ct.copy_template(tfo, tdo, number_copies=-1)
-        assert ct.copy_template(tfo, tdo, number_copies=1) == [True]
+        assert list(ct.copy_template(tfo, tdo, number_copies=1)) == [True]
         results = ct.copy_template(tfo, tdo, number_copies=100)
         assert len(results) == 100
         assert all(results)
 
 
+    def test_copy_template_memory_backend(self):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/dailys")
+        memory.write(memory.resolve("/vault/templates/daily.md"), [b"# daily"])
+        for iso_name in ["2025-01-01.md", "2025-01-02.md"]:
+            memory.write(memory.resolve("/vault/dailys") / iso_name, [])
+
+        assert list(ct.copy_template("/vault/templates/daily.md", "/vault/dailys", backend=memory)) == [True]
+        expected_file = memory.resolve("/vault/dailys") / (datetime.date.today().isoformat() + ".md")
+        assert memory.read_bytes(expected_file) == b"# daily"
+        results = ct.copy_template("/vault/templates/daily.md", "/vault/dailys", number_copies=50, backend=memory)
+        assert len(results) == 50
+        assert all(results)
+        assert len(memory.list(memory.resolve("/vault/dailys"))) == 53
+        with pytest.raises(FileNotFoundError):
+            ct.copy_template("/vault/templates/weekly.md", "/vault/dailys", backend=memory)
+        with pytest.raises(NotADirectoryError):
+            ct.process_directory_location("/vault/templates/daily.md", backend=memory)
+
+
+    def test_copy_template_records_errors(self, tmp_path):
+        template_file = tmp_path / "template_file.md"
+        template_file.write_text("# note")
+        (tmp_path / "notes").mkdir()
+        # targets outside the archive root make the backend raise a ValueError on every write
+        with backends.ArchiveBackend(tmp_path / "staged.zip", root=tmp_path / "elsewhere") as archive:
+            results = ct.copy_template(template_file, tmp_path / "notes", number_copies=3, backend=archive)
+        assert len(results) == 3
+        assert results.counts() == {"failed": 3}
+        assert [failure.errno for failure in results.failures()] == [0, 0, 0]
+
+
     def test_analyze_directory(self, tmp_path):
         usual_result = {
             "detected_formatting": False,
@@ -227,7 +303,7 @@ class TestCopyTemplate:
         
         result = ct.copy_template_single(template_file, target_dir)
         print(result)
-        assert isinstance(result, list)
+        assert isinstance(result, cr.CopyResults)
         assert all(result)
         copied_file = target_dir / expected_file
         assert copied_file.exists()
@@ -0,0 +1,176 @@
+from templates import journal as jr
+from templates import copy_template as ct
+from templates import backends
+import pytest
+import datetime
+
+class TestJournal:
+
+    def test_batch_journal(self, tmp_path):
+        journal_file = tmp_path / "journals" / "batch.jsonl"
+        plan = {"kind": "multiple", "count": 5}
+        with jr.BatchJournal(journal_file) as journal:
+            assert journal.resume(plan) is None
+            journal.start(plan)
+            for index, succeeded in [(0, True), (1, False), (2, True)]:
+                journal.begin(index)
+                journal.record(index, succeeded)
+            journal.begin(3)
+
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            assert journal.resume(plan) == plan
+            assert [journal.is_completed(index) for index in range(5)] == [True, False, True, False, False]
+            assert journal.in_flight == {3}
+            journal.begin(1)
+            journal.record(1, True)
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            journal.resume(plan)
+            assert journal.in_flight == {3}
+            with pytest.raises(ValueError):
+                jr.BatchJournal(journal_file, resume=True).resume({"kind": "multiple", "count": 6})
+
+        # a crash in the middle of appending leaves half an entry behind
+        with open(journal_file, "a") as f:
+            f.write('{"index":3,"succ')
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            journal.resume(plan)
+            assert journal.in_flight == {3}
+            assert not journal.is_completed(3)
+            journal.record(3, True)
+        entries, _ = jr.read_journal_entries(journal_file)
+        assert entries[-1] == {"index": 3, "succeeded": True}
+
+        journal_file.write_text('{"plan":{"kind":')
+        assert jr.BatchJournal(journal_file, resume=True).resume(plan) is None
+
+
+    def test_resume_multiple(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        template_file.write_text("# template note")
+        journal_file = tmp_path / "batch.jsonl"
+        with jr.BatchJournal(journal_file) as journal:
+            results = ct.copy_template_multiple(template_file, target_dir, 3, journal=journal)
+        assert all(results)
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            with pytest.raises(ValueError):
+                ct.copy_template_multiple(template_file, target_dir, 10, journal=journal)
+
+        # simulate an interrupted run of 10: copy 3 was cut off half way through
+        plan = {"kind": "multiple", "template": str(template_file), "destination": str(target_dir), "count": 10}
+        with jr.BatchJournal(journal_file) as journal:
+            journal.start(plan)
+            for index in range(3):
+                journal.begin(index)
+                journal.record(index, True)
+            journal.begin(3)
+        (target_dir / "template_file-copy-3.txt").write_text("# templ")
+
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            results = ct.copy_template_multiple(template_file, target_dir, 10, journal=journal)
+        assert len(results) == 7
+        assert all(results)
+        assert [results.record_at(position).index for position in range(7)] == [3, 4, 5, 6, 7, 8, 9]
+        assert (target_dir / "template_file-copy-3.txt").read_text() == "# template note"
+
+        # an in-flight target that is not a prefix of the template is never removed
+        with jr.BatchJournal(journal_file) as journal:
+            (target_dir / "template_file-copy-10.txt").write_text("user note")
+            journal.start({"kind": "multiple", "template": str(template_file.resolve()),
+                "destination": str(target_dir.resolve()), "count": 11})
+            for index in range(10):
+                journal.begin(index)
+                journal.record(index, True)
+            journal.begin(10)
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            results = ct.copy_template_multiple(template_file.resolve(), target_dir.resolve(), 11, journal=journal)
+        assert results.counts() == {"exists": 1}
+        assert (target_dir / "template_file-copy-10.txt").read_text() == "user note"
+
+
+    def test_resume_date_range(self, tmp_path, monkeypatch):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/dailys")
+        memory.write(memory.resolve("/vault/templates/daily.md"), [b"# daily"])
+        memory.write(memory.resolve("/vault/dailys/2025_01_01.md"), [b""])
+        template_path, target_path = memory.resolve("/vault/templates/daily.md"), memory.resolve("/vault/dailys")
+        start_date, end_date = datetime.date(2025, 1, 2), datetime.date(2025, 1, 11)
+        journal_file = tmp_path / "batch.jsonl"
+
+        write = memory.write
+        def interrupting_write(path, chunks, mode=None):
+            if path.name == "2025_01_06.md":
+                raise KeyboardInterrupt
+            write(path, chunks, mode)
+        monkeypatch.setattr(memory, "write", interrupting_write)
+        with pytest.raises(KeyboardInterrupt):
+            with jr.BatchJournal(journal_file) as journal:
+                ct.copy_template_date_range(template_path, target_path, start_date, end_date, backend=memory,
+                    journal=journal)
+        assert len(memory.list(target_path)) == 5
+
+        # resuming neither lists the directory again nor stats the copied targets
+        monkeypatch.setattr(memory, "write", write)
+        monkeypatch.setattr(memory, "list", lambda directory: pytest.fail("directory was scanned again"))
+        statted = []
+        stat = memory.stat
+        monkeypatch.setattr(memory, "stat", lambda path: statted.append(path.name) or stat(path))
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            results = ct.copy_template_date_range(template_path, target_path, start_date, end_date, backend=memory,
+                journal=journal)
+        assert len(results) == 6
+        assert all(results)
+        assert not {"2025_01_02.md", "2025_01_05.md"} & set(statted)
+        assert memory.read_bytes(target_path / "2025_01_11.md") == b"# daily"
+
+
+    def test_resume_interrupted_retry(self, tmp_path, monkeypatch):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/notes")
+        memory.write(memory.resolve("/vault/templates/n.md"), [b"# full note"])
+        memory.write(memory.resolve("/vault/notes/n-copy-2.md"), [b"blocking note"])
+        template_path, target_path = memory.resolve("/vault/templates/n.md"), memory.resolve("/vault/notes")
+        journal_file = tmp_path / "batch.jsonl"
+
+        write = memory.write
+        def interrupting_write(interrupted_name, partial_data):
+            def partial_write(path, chunks, mode=None):
+                if path.name != interrupted_name:
+                    return write(path, chunks, mode)
+                write(path, [partial_data], mode)
+                raise KeyboardInterrupt
+            return partial_write
+
+        # index 2 fails on the blocking note and the run is interrupted at index 5
+        monkeypatch.setattr(memory, "write", interrupting_write("n-copy-5.md", b""))
+        with pytest.raises(KeyboardInterrupt):
+            with jr.BatchJournal(journal_file) as journal:
+                ct.copy_template_multiple(template_path, target_path, 8, backend=memory, journal=journal)
+        memory.remove(target_path / "n-copy-2.md")
+
+        # retrying index 2 is interrupted half way through its write
+        monkeypatch.setattr(memory, "write", interrupting_write("n-copy-2.md", b"# fu"))
+        with pytest.raises(KeyboardInterrupt):
+            with jr.BatchJournal(journal_file, resume=True) as journal:
+                ct.copy_template_multiple(template_path, target_path, 8, backend=memory, journal=journal)
+        assert memory.read_bytes(target_path / "n-copy-2.md") == b"# fu"
+
+        monkeypatch.setattr(memory, "write", write)
+        with jr.BatchJournal(journal_file, resume=True) as journal:
+            results = ct.copy_template_multiple(template_path, target_path, 8, backend=memory, journal=journal)
+        assert all(results)
+        assert [results.record_at(position).index for position in range(len(results))] == [2, 5, 6, 7]
+        for index in range(8):
+            assert memory.read_bytes(target_path / f"n-copy-{index}.md") == b"# full note"
+
+
+    @staticmethod
+    def helper_create_template_structure(temp_path):
+        template_dir = temp_path / "template_dir"
+        template_dir.mkdir(parents=True)
+        template_file = template_dir / "template_file.txt"
+        template_file.touch()
+        target_dir = temp_path / "target_dir"
+        target_dir.mkdir(parents=True)
+        return template_file, target_dir
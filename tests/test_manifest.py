@@ -0,0 +1,162 @@
+from templates import manifest as mf
+from templates import backends
+import pytest
+import datetime
+import threading
+
+class TestManifest:
+
+    def test_load_manifest(self, tmp_path):
+        manifest_file = tmp_path / "manifest.toml"
+        manifest_file.write_text(
+            '[scheduler]\n'
+            'device_concurrency = 2\n'
+            '[defaults]\n'
+            'use_formatting = false\n'
+            '[[jobs]]\n'
+            'name = "weekly review"\n'
+            'template = "templates/weekly.md"\n'
+            'destination = "reviews"\n'
+            '[[jobs]]\n'
+            'template = "templates/daily.md"\n'
+            'destination = "dailys"\n'
+            'start = 2025-01-06\n'
+            'end = 2025-01-10\n'
+            'use_formatting = true\n'
+        )
+        loaded = mf.load_manifest(manifest_file)
+        assert loaded["device_concurrency"] == 2
+        weekly, daily = loaded["jobs"]
+        assert weekly["name"] == "weekly review"
+        assert weekly["template"] == tmp_path / "templates" / "weekly.md"
+        assert weekly["count"] == 1
+        assert weekly["use_formatting"] == False
+        assert daily["name"] == "job 2"
+        assert daily["start"] == datetime.date(2025, 1, 6)
+        assert daily["use_formatting"] == True
+
+        with pytest.raises(FileNotFoundError):
+            mf.load_manifest(tmp_path / "missing.toml")
+        bad_manifests = [
+            'jobs = "not toml',
+            '[scheduler]\ndevice_concurrency = 0\n[[jobs]]\ntemplate = "t.md"\ndestination = "d"\n',
+            '[[jobs]]\ntemplate = "t.md"\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\nstart = 2025-01-01\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\nstart = 2025-01-01\nend = 2025-01-02\ncount = 2\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\ncount = -1\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\ncolour = "red"\n',
+            '[scheduler]\ndevice_concurrency = 1\n',
+            'jobs = "x"\n',
+            'jobs = ["x"]\n',
+            'scheduler = 3\n[[jobs]]\ntemplate = "t.md"\ndestination = "d"\n',
+            'defaults = "x"\n[[jobs]]\ntemplate = "t.md"\ndestination = "d"\n',
+            '[scheduler]\ndevice_concurrency = true\n[[jobs]]\ntemplate = "t.md"\ndestination = "d"\n',
+            '[[jobs]]\ntemplate = 5\ndestination = "d"\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = ["d"]\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\nuse_formatting = "yes"\n',
+            '[[jobs]]\ntemplate = "t.md"\ndestination = "d"\ncount = true\n',
+        ]
+        for bad_manifest in bad_manifests:
+            manifest_file.write_text(bad_manifest)
+            with pytest.raises(ValueError):
+                mf.load_manifest(manifest_file)
+
+
+    def test_run_manifest(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "daily.md").write_text("# daily")
+        (tmp_path / "templates" / "meeting.md").write_text("# meeting")
+        (tmp_path / "dailys").mkdir()
+        (tmp_path / "meetings").mkdir()
+        manifest_file = tmp_path / "manifest.toml"
+        manifest_file.write_text(
+            '[scheduler]\n'
+            'device_concurrency = 2\n'
+            '[[jobs]]\n'
+            'name = "dailies"\n'
+            'template = "templates/daily.md"\n'
+            'destination = "dailys"\n'
+            'start = 2025-01-06\n'
+            'end = 2025-01-10\n'
+            '[[jobs]]\n'
+            'name = "meetings"\n'
+            'template = "templates/meeting.md"\n'
+            'destination = "meetings"\n'
+            'count = 3\n'
+            '[[jobs]]\n'
+            'name = "missing"\n'
+            'template = "templates/missing.md"\n'
+            'destination = "meetings"\n'
+        )
+        loaded = mf.load_manifest(manifest_file)
+        summaries = mf.run_manifest(loaded["jobs"], loaded["device_concurrency"])
+        dailies, meetings, missing = summaries
+        assert list(dailies["results"]) == [True] * 5
+        assert (tmp_path / "dailys" / "2025-01-08.md").read_text() == "# daily"
+        assert list(meetings["results"]) == [True] * 3
+        assert (tmp_path / "meetings" / "meeting-copy-2.md").read_text() == "# meeting"
+        assert len(missing["results"]) == 0
+        assert "missing.md" in missing["error"]
+
+
+    def test_run_manifest_shared(self, monkeypatch):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/projects")
+        memory.write(memory.resolve("/vault/templates/daily.md"), [b"# daily"])
+        reads, listings = [], []
+        read_bytes, listing = memory.read_bytes, memory.list
+        monkeypatch.setattr(memory, "read_bytes", lambda path: reads.append(path) or read_bytes(path))
+        monkeypatch.setattr(memory, "list", lambda path: listings.append(path) or listing(path))
+
+        job = {"template": "/vault/templates/daily.md", "destination": "/vault/projects", "use_formatting": True}
+        jobs = [
+            {**job, "name": "january", "count": 1, "start": datetime.date(2025, 1, 1), "end": datetime.date(2025, 1, 31)},
+            {**job, "name": "february", "count": 1, "start": datetime.date(2025, 2, 1), "end": datetime.date(2025, 2, 28)},
+            {**job, "name": "overlap", "count": 1, "start": datetime.date(2025, 2, 28), "end": datetime.date(2025, 2, 28)},
+        ]
+        january, february, overlap = mf.run_manifest(jobs, device_concurrency=4, backend=memory)
+        assert len(reads) == 1
+        assert len(listings) == 1
+        assert all(january["results"]) and len(january["results"]) == 31
+        assert all(february["results"]) and len(february["results"]) == 28
+        assert overlap["results"].counts() == {"exists": 1}
+        assert len(memory.list(memory.resolve("/vault/projects"))) == 59
+
+
+    def test_run_manifest_devices(self):
+        class DeviceBackend(backends.MemoryBackend):
+            # every top level directory is its own device, and the first write on each
+            # device waits until the other device is writing too
+            def __init__(self):
+                super().__init__()
+                self.barrier = threading.Barrier(2, timeout=5)
+                self.waiting = set()
+
+            def stat(self, path):
+                entry_stat = super().stat(path)
+                if entry_stat is None or len(self.resolve(path).parts) < 2:
+                    return entry_stat
+                return entry_stat._replace(device=int(self.resolve(path).parts[1][-1]))
+
+            def write(self, path, chunks, mode=None):
+                device = int(self.resolve(path).parts[1][-1])
+                if device in self.waiting:
+                    self.waiting.discard(device)
+                    self.barrier.wait()
+                super().write(path, chunks, mode)
+
+        memory = DeviceBackend()
+        for directory in ["/disk1/first", "/disk1/second", "/disk1/third", "/disk2/only"]:
+            memory.create(directory)
+        memory.write(memory.resolve("/disk2/note.md"), [b"# note"])
+        memory.waiting = {1, 2}
+
+        jobs = [
+            {"name": directory, "template": "/disk2/note.md", "destination": directory, "count": 2,
+                "start": None, "end": None, "use_formatting": True}
+            for directory in ["/disk1/first", "/disk1/second", "/disk1/third", "/disk2/only"]
+        ]
+        summaries = mf.run_manifest(jobs, device_concurrency=1, backend=memory)
+        assert not memory.barrier.broken
+        assert all(all(summary["results"]) and len(summary["results"]) == 2 for summary in summaries)
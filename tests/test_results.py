@@ -0,0 +1,69 @@
+from templates import results as cr
+import pytest
+import errno
+import json
+
+class TestResults:
+
+    def test_record(self):
+        results = cr.CopyResults()
+
+        def raise_error(error):
+            raise error
+
+        assert results.record(0, lambda: True) == True
+        assert results.record(1, lambda: False) == False
+        assert results.record(2, lambda: raise_error(FileExistsError("exists"))) == False
+        assert results.record(3, lambda: raise_error(IsADirectoryError("directory"))) == False
+        assert results.record(4, lambda: raise_error(OSError(errno.ENOSPC, "full"))) == False
+        assert results.record(5, lambda: raise_error(ValueError("not an os error"))) == False
+        with pytest.raises(KeyboardInterrupt):
+            results.record(6, lambda: raise_error(KeyboardInterrupt()))
+
+        assert len(results) == 6
+        assert list(results) == [True, False, False, False, False, False]
+        assert results[0] and not results[-1]
+        failures = list(results.failures())
+        assert [failure.index for failure in failures] == [1, 2, 3, 4, 5]
+        assert [failure.status for failure in failures] == [cr.FAILED, cr.EXISTS, cr.IS_DIRECTORY, cr.FAILED, cr.FAILED]
+        assert [failure.errno for failure in failures] == [0, errno.EEXIST, errno.EISDIR, errno.ENOSPC, 0]
+        assert [failure.exception for failure in failures] == [None, None, None, None, "ValueError"]
+        assert results.record_at(-1).exception == "ValueError"
+
+        combined = cr.CopyResults()
+        combined.record(0, lambda: raise_error(TypeError("backend bug")))
+        combined.extend(results)
+        assert [failure.exception for failure in combined.failures()] == ["TypeError"] + [None] * 4 + ["ValueError"]
+        exported = json.loads(combined.to_json())
+        assert exported["failures"][0]["error"] == "TypeError"
+        assert exported["failures"][-1]["error"] == "ValueError"
+        assert all(failure.seconds >= 0 for failure in failures)
+
+
+    def test_summary(self):
+        results = cr.CopyResults()
+        for index in range(1000):
+            results.append(index, cr.SUCCEEDED if index % 10 else cr.EXISTS, 0 if index % 10 else errno.EEXIST, 0.5)
+        other = cr.CopyResults()
+        other.append(0, cr.FAILED, errno.EACCES, 0.25)
+        results.extend(other)
+
+        assert results.succeeded == 900
+        assert results.failed == 101
+        assert results.counts() == {"succeeded": 900, "failed": 1, "exists": 100}
+        assert results.summary() == {
+            "total": 1001,
+            "succeeded": 900,
+            "failed": 101,
+            "statuses": {"succeeded": 900, "failed": 1, "exists": 100},
+            "seconds": 500.25,
+        }
+        exported = json.loads(results.to_json())
+        assert exported["summary"] == results.summary()
+        assert len(exported["failures"]) == 101
+        assert exported["failures"][1]["index"] == 10
+        assert exported["failures"][1]["status"] == "exists"
+        assert exported["failures"][1]["errno"] == errno.EEXIST
+        assert isinstance(exported["failures"][1]["error"], str)
+        assert exported["failures"][-1]["status"] == "failed"
+        assert exported["failures"][-1]["errno"] == errno.EACCES
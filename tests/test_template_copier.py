@@ -0,0 +1,117 @@
+from templates import template_copier as tc
+from templates import backends
+import pytest
+import datetime
+
+class TestTemplateCopier:
+
+    def test_copy(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        template_file.write_text("# template")
+        copier = tc.TemplateCopier(template_file, target_dir)
+
+        assert copier.copy() == True
+        assert (target_dir / "template_file-copy.txt").read_text() == "# template"
+        with pytest.raises(FileExistsError):
+            copier.copy()
+        assert copier.copy("named.txt") == True
+        (target_dir / "folder").mkdir()
+        copier.refresh()
+        with pytest.raises(IsADirectoryError):
+            copier.copy("folder")
+
+
+    def test_copy_formatting(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        for iso_name in ["2025_01_01.txt", "2025_01_02.txt"]:
+            (target_dir / iso_name).touch()
+        copier = tc.TemplateCopier(template_file, target_dir)
+        assert copier.copy() == True
+        expected_file = datetime.date.today().isoformat().replace("-", "_") + ".txt"
+        assert (target_dir / expected_file).exists()
+
+        unformatted = tc.TemplateCopier(template_file, target_dir, use_formatting=False)
+        assert unformatted.copy() == True
+        assert (target_dir / "template_file-copy.txt").exists()
+
+
+    def test_copy_many(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        copier = tc.TemplateCopier(template_file, target_dir)
+        with pytest.raises(ValueError):
+            copier.copy_many(-1)
+        assert len(copier.copy_many(0)) == 0
+        results = copier.copy_many(25)
+        assert len(results) == 25
+        assert all(results)
+        assert (target_dir / "template_file-copy-24.txt").exists()
+        repeated = copier.copy_many(26)
+        assert repeated.succeeded == 1
+        assert repeated.counts() == {"succeeded": 1, "exists": 25}
+
+
+    def test_refresh(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        template_file.write_text("first")
+        copier = tc.TemplateCopier(template_file, target_dir)
+
+        (target_dir / "template_file-copy.txt").touch()
+        template_file.write_text("second")
+        with pytest.raises(FileExistsError):
+            copier.copy()
+        assert copier.copy("stale.txt") == True
+        assert (target_dir / "stale.txt").read_text() == "first"
+
+        copier.refresh()
+        assert copier.copy("fresh.txt") == True
+        assert (target_dir / "fresh.txt").read_text() == "second"
+
+
+    def test_copy_streaming(self, tmp_path, monkeypatch):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        template_file.write_bytes(b"large canvas" * 100)
+        monkeypatch.setattr(backends, "STREAM_THRESHOLD", 64)
+        progress = []
+        callback = lambda copied, total, rate: progress.append(copied)
+
+        copier = tc.TemplateCopier(template_file, target_dir, progress_callback=callback)
+        assert copier.template.data is None
+        assert copier.copy() == True
+        assert (target_dir / "template_file-copy.txt").read_bytes() == template_file.read_bytes()
+        assert progress[-1] == 1200
+
+
+    def test_copy_memory_backend(self):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/notes")
+        memory.write(memory.resolve("/vault/templates/note.md"), [b"# note"], 0o600)
+        copier = tc.TemplateCopier("/vault/templates/note.md", "/vault/notes", backend=memory)
+
+        results = copier.copy_many(1000)
+        assert len(results) == 1000
+        assert all(results)
+        copied_file = memory.resolve("/vault/notes/note-copy-999.md")
+        assert memory.read_bytes(copied_file) == b"# note"
+        assert memory.stat(copied_file).mode == 0o600
+
+
+    def test_copy_failures(self, tmp_path):
+        template_file, target_dir = self.helper_create_template_structure(tmp_path)
+        template_file.write_text("# template")
+        # targets outside the archive root make the backend raise a ValueError on every write
+        with backends.ArchiveBackend(tmp_path / "staged.zip", root=tmp_path / "elsewhere") as archive:
+            copier = tc.TemplateCopier(template_file, target_dir, backend=archive)
+            assert copier.copy() == False
+            assert copier.copy_many(2).counts() == {"failed": 2}
+
+
+    @staticmethod
+    def helper_create_template_structure(temp_path):
+        template_dir = temp_path / "template_dir"
+        template_dir.mkdir(parents=True)
+        template_file = template_dir / "template_file.txt"
+        template_file.touch()
+        target_dir = temp_path / "target_dir"
+        target_dir.mkdir(parents=True)
+        return template_file, target_dir
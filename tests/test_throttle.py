@@ -0,0 +1,91 @@
+from templates import throttle as th
+from templates import copy_template as ct
+from templates import backends
+import pytest
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+class TestThrottle:
+
+    def test_parse_rate(self):
+        assert th.parse_rate("20") == (20.0, None)
+        assert th.parse_rate("2.5/s") == (2.5, None)
+        assert th.parse_rate("512KB") == (None, 512 * 1024)
+        assert th.parse_rate("4MB/s") == (None, 4 * 1024 * 1024)
+        assert th.parse_rate("100b") == (None, 100)
+        for bad_rate in ["", "fast", "0", "-5", "4TB", "5 files"]:
+            with pytest.raises(ValueError):
+                th.parse_rate(bad_rate)
+
+
+    def test_throttle(self):
+        clock = FakeClock()
+        throttle = th.Throttle(files_per_second=4, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            throttle.before_copy()
+            clock.now += 0.05
+            throttle.after_copy(100, 0.05)
+        assert clock.slept == [0.2, 0.2, 0.2, 0.2]
+        summary = throttle.summary()
+        assert summary["files"] == 5
+        assert summary["bytes"] == 500
+        assert summary["seconds"] == pytest.approx(1.05)
+        assert summary["files_per_second"] == pytest.approx(5 / 1.05)
+
+        clock = FakeClock()
+        byte_throttle = th.Throttle(files_per_second=100, bytes_per_second=1000, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            byte_throttle.before_copy()
+            byte_throttle.after_copy(500, 0.0)
+        assert clock.slept == [0.5, 0.5]
+        assert th.Throttle().summary()["files_per_second"] == 0.0
+
+
+    def test_adaptive_throttle(self):
+        clock = FakeClock()
+        throttle = th.AdaptiveThrottle(min_files_per_second=10, clock=clock, sleep=clock.sleep)
+        latencies = [0.001] * 10 + [0.01] * 10 + [0.001] * 60
+        intervals = []
+        for latency in latencies:
+            throttle.before_copy()
+            clock.now += latency
+            throttle.after_copy(10, latency)
+            intervals.append(throttle.next_copy - throttle.copy_started)
+
+        # fast writes are not throttled at all
+        assert intervals[:10] == [0.0] * 10
+        # climbing latency doubles the spacing up to the minimum rate
+        assert throttle.backoffs > 0
+        assert max(intervals) == pytest.approx(0.1)
+        assert intervals[11] > intervals[10] > 0
+        # and the spacing recovers once writes are quick again
+        assert intervals[-1] == 0.0
+        assert throttle.summary()["backoffs"] == throttle.backoffs
+
+
+    def test_throttled_copy(self):
+        memory = backends.MemoryBackend()
+        memory.create("/vault/templates")
+        memory.create("/vault/notes")
+        memory.write(memory.resolve("/vault/templates/note.md"), [b"# note"])
+        template_path, target_path = memory.resolve("/vault/templates/note.md"), memory.resolve("/vault/notes")
+
+        clock = FakeClock()
+        throttle = th.Throttle(files_per_second=10, clock=clock, sleep=clock.sleep)
+        results = ct.copy_template_multiple(template_path, target_path, 20, backend=memory, throttle=throttle)
+        assert all(results)
+        assert len(clock.slept) == 19
+        assert throttle.summary()["bytes"] == 20 * len(b"# note")
+        assert throttle.summary()["files_per_second"] == pytest.approx(20 / 1.9)